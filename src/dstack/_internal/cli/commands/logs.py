@@ -19,6 +19,12 @@ class LogsCommand(APIBaseCommand):
         self._parser.add_argument(
             "-d", "--diagnose", action="store_true", help="Show run diagnostic logs"
         )
+        self._parser.add_argument(
+            "-f",
+            "--follow",
+            action="store_true",
+            help="Wait for new logs until the job is finished",
+        )
         self._parser.add_argument(
             "--replica",
             help="The replica number. Defaults to 0.",
@@ -53,6 +59,7 @@ class LogsCommand(APIBaseCommand):
             diagnose=args.diagnose,
             replica_num=args.replica,
             job_num=args.job,
+            follow=args.follow,
         )
         try:
             for log in logs:
@@ -26,6 +26,10 @@ class MethodNotAllowedError(ClientError):
     pass
 
 
+class StreamInterruptedError(ClientError):
+    pass
+
+
 class ServerClientErrorCode(str, enum.Enum):
     UNSPECIFIED_ERROR = "error"
     RESOURCE_EXISTS = "resource_exists"
@@ -49,6 +49,7 @@ from dstack._internal.server.routers import (
     users,
     volumes,
 )
+from dstack._internal.server.services import logs as logs_services
 from dstack._internal.server.services import prometheus as prometheus_service
 from dstack._internal.server.services.config import ServerConfigManager
 from dstack._internal.server.services.gateways import gateway_connections_pool
@@ -210,6 +211,7 @@ async def lifespan(app: FastAPI):
         scheduler.shutdown()
     if pipeline_manager is not None:
         await pipeline_manager.drain()
+    await run_async(logs_services.flush_logs)
     await gateway_connections_pool.remove_all()
     await job_server_connections_pool.remove_all()
     service_conn_pool = await get_injector_from_app(app).get_service_connection_pool()
@@ -195,6 +195,6 @@ def set_gpu_driver_update(
     current = job_provisioning_data.gpu_driver
     if current == gpu_driver:
         return False
-    job_provisioning_data.gpu_driver = gpu_driver
+    job_provisioning_data = job_provisioning_data.model_copy(update={"gpu_driver": gpu_driver})
     update_map["job_provisioning_data"] = job_provisioning_data.model_dump_json()
     return True
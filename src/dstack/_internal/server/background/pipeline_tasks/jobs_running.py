@@ -102,7 +102,7 @@ from dstack._internal.server.services.jobs.server_connection import (
 )
 from dstack._internal.server.services.locking import get_locker
 from dstack._internal.server.services.logging import fmt
-from dstack._internal.server.services.metrics import get_job_metrics
+from dstack._internal.server.services.metrics import RAW_RESOLUTION_SECONDS, get_job_metrics
 from dstack._internal.server.services.pipelines import PipelineHinterProtocol
 from dstack._internal.server.services.repos import (
     get_code_model,
@@ -434,6 +434,8 @@ async def _load_process_context(item: JobRunningPipelineItem) -> Optional[_Proce
             )
             run = run_model_to_run(run_model, include_sensitive=True)
             job = find_job(run.jobs, job_model.replica_num, job_model.job_num)
+            # Secrets and IPs are interpolated into the spec in place.
+            job = job.model_copy(update={"job_spec": job.job_spec.model_copy(deep=True)})
         instance_access_revoked = await _is_instance_access_revoked(session, job_model)
         job_submission = job_model_to_job_submission(job_model)
         server_ssh_private_keys = get_instance_ssh_private_keys(get_or_error(job_model.instance))
@@ -1289,7 +1291,12 @@ async def _check_gpu_utilization(
 
     after = get_current_datetime() - timedelta(seconds=policy.time_window)
     async with get_session_ctx() as session:
-        job_metrics = await get_job_metrics(session, context.job_model, after=after)
+        job_metrics = await get_job_metrics(
+            session,
+            context.job_model,
+            after=after,
+            resolution_seconds=RAW_RESOLUTION_SECONDS,
+        )
     gpus_util_metrics: list[Metric] = []
     for metric in job_metrics.metrics:
         if metric.name.startswith("gpu_util_percent_gpu"):
@@ -2080,10 +2080,13 @@ async def _apply_volume_attachment_result(
     instance_model: InstanceModel,
     volume_attachment_result: _VolumeAttachmentResult,
 ) -> None:
-    job_runtime_data = get_or_error(get_job_runtime_data(job_model))
-    job_runtime_data.volume_names = [
-        attachment.volume_name for attachment in volume_attachment_result.attachments
-    ]
+    job_runtime_data = get_or_error(get_job_runtime_data(job_model)).model_copy(
+        update={
+            "volume_names": [
+                attachment.volume_name for attachment in volume_attachment_result.attachments
+            ]
+        }
+    )
     job_model.job_runtime_data = job_runtime_data.model_dump_json()
 
     volume_ids = [attachment.volume_id for attachment in volume_attachment_result.attachments]
@@ -1,7 +1,9 @@
 import asyncio
 import json
+import time
+import uuid
 from collections.abc import Mapping
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy import Delete, delete, select
 from sqlalchemy.orm import joinedload
@@ -10,89 +12,185 @@ from dstack._internal.core.consts import DSTACK_RUNNER_HTTP_PORT
 from dstack._internal.core.models.runs import JobStatus
 from dstack._internal.server import settings
 from dstack._internal.server.db import get_session_ctx
-from dstack._internal.server.models import InstanceModel, JobMetricsPoint, JobModel, ProjectModel
+from dstack._internal.server.models import (
+    InstanceModel,
+    JobMetricsPoint,
+    JobMetricsRollup,
+    JobModel,
+    ProjectModel,
+)
 from dstack._internal.server.schemas.runner import MetricsResponse
 from dstack._internal.server.services.instances import get_instance_ssh_private_keys
 from dstack._internal.server.services.jobs import get_job_provisioning_data, get_job_runtime_data
+from dstack._internal.server.services.metrics import (
+    ROLLUP_RESOLUTIONS_SECONDS,
+    ROLLUP_RETENTION_SECONDS,
+    align_timestamp_micro,
+    rollup_job_metrics_points,
+    rollup_job_metrics_rollups,
+)
+from dstack._internal.server.services.prometheus.client_metrics import (
+    job_metrics_collection_metrics,
+)
 from dstack._internal.server.services.runner import client
 from dstack._internal.server.services.runner.ssh import runner_ssh_tunnel
 from dstack._internal.server.utils import tracing
-from dstack._internal.utils.common import batched, get_current_datetime, get_or_error, run_async
+from dstack._internal.utils.common import get_current_datetime, get_or_error, run_async
 from dstack._internal.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-MAX_JOBS_FETCHED = 100
-BATCH_SIZE = 10
+MAX_JOBS_FETCHED = 1000
+# Must match the `collect_metrics` scheduling interval
+COLLECT_INTERVAL_SECONDS = 10
 MIN_COLLECT_INTERVAL_SECONDS = 9
+# Collection of jobs starts evenly spread over this part of the interval,
+# the rest is left for the last jobs to complete before the next run.
+SPREAD_INTERVAL_SECONDS = 8
+# Number of jobs whose metrics are rolled up in one transaction.
+ROLLUP_BATCH_SIZE = 100
+
+# Monotonic time of the last successful collection per job, for the achieved interval metric.
+_last_collected_at: Dict[uuid.UUID, float] = {}
 
 
 @tracing.instrument_scheduled_task
 async def collect_metrics():
-    async with get_session_ctx() as session:
-        res = await session.execute(
-            select(JobModel)
-            .where(JobModel.status.in_([JobStatus.RUNNING]))
-            .options(
-                joinedload(JobModel.instance)
-                .joinedload(InstanceModel.project)
-                .load_only(ProjectModel.ssh_private_key)
+    job_models = await _get_running_jobs()
+    job_models = await _filter_recently_collected_jobs(job_models)
+    running_job_ids = {j.id for j in job_models}
+    for job_id in list(_last_collected_at):
+        if job_id not in running_job_ids:
+            del _last_collected_at[job_id]
+    if len(job_models) == 0:
+        return
+    # Each job gets its own slot within the interval so that collection load is spread evenly
+    # and no job waits for a batch. The semaphore bounds the number of concurrent SSH requests.
+    start = time.monotonic()
+    deadline = start + COLLECT_INTERVAL_SECONDS
+    semaphore = asyncio.Semaphore(settings.SERVER_METRICS_COLLECTION_CONCURRENCY)
+    step = SPREAD_INTERVAL_SECONDS / len(job_models)
+    points = await asyncio.gather(
+        *(
+            _collect_job_metrics_in_slot(
+                job_model, slot=start + i * step, deadline=deadline, semaphore=semaphore
             )
-            .order_by(JobModel.last_processed_at.asc())
-            .limit(MAX_JOBS_FETCHED)
+            for i, job_model in enumerate(job_models)
         )
-        job_models = res.unique().scalars().all()
+    )
+    async with get_session_ctx() as session:
+        session.add_all([p for p in points if p is not None])
+        await session.commit()
+
 
-    for batch in batched(job_models, BATCH_SIZE):
-        await _collect_jobs_metrics(batch)
+async def _get_running_jobs() -> List[JobModel]:
+    job_models: List[JobModel] = []
+    last_job_id: Optional[uuid.UUID] = None
+    async with get_session_ctx() as session:
+        while True:
+            stmt = (
+                select(JobModel)
+                .where(JobModel.status.in_([JobStatus.RUNNING]))
+                .options(
+                    joinedload(JobModel.instance)
+                    .joinedload(InstanceModel.project)
+                    .load_only(ProjectModel.ssh_private_key)
+                )
+                .order_by(JobModel.id)
+                .limit(MAX_JOBS_FETCHED)
+            )
+            if last_job_id is not None:
+                stmt = stmt.where(JobModel.id > last_job_id)
+            res = await session.execute(stmt)
+            page = res.unique().scalars().all()
+            job_models.extend(page)
+            if len(page) < MAX_JOBS_FETCHED:
+                return job_models
+            last_job_id = page[-1].id
+
+
+async def _collect_job_metrics_in_slot(
+    job_model: JobModel,
+    slot: float,
+    deadline: float,
+    semaphore: asyncio.Semaphore,
+) -> Optional[JobMetricsPoint]:
+    await asyncio.sleep(max(slot - time.monotonic(), 0))
+    async with semaphore:
+        if time.monotonic() >= deadline:
+            # Concurrency is saturated, the job will be collected on the next run
+            logger.debug("Skipping job %s metrics collection, deadline missed", job_model.job_name)
+            job_metrics_collection_metrics.increment_missed_jobs()
+            return None
+        point = await _collect_job_metrics(job_model)
+    if point is not None:
+        now = time.monotonic()
+        last_collected_at = _last_collected_at.get(job_model.id)
+        if last_collected_at is not None:
+            job_metrics_collection_metrics.observe_collection_interval(now - last_collected_at)
+        _last_collected_at[job_model.id] = now
+    return point
 
 
 @tracing.instrument_scheduled_task
 async def delete_metrics():
     now_timestamp_micro = int(get_current_datetime().timestamp() * 1_000_000)
-    running_timestamp_micro_cutoff = (
-        now_timestamp_micro - settings.SERVER_METRICS_RUNNING_TTL_SECONDS * 1_000_000
-    )
     finished_timestamp_micro_cutoff = (
         now_timestamp_micro - settings.SERVER_METRICS_FINISHED_TTL_SECONDS * 1_000_000
     )
-    await asyncio.gather(
-        _execute_delete_statement(
-            delete(JobMetricsPoint).where(
-                JobMetricsPoint.job_id.in_(
-                    select(JobModel.id).where(JobModel.status.in_([JobStatus.RUNNING]))
-                ),
-                JobMetricsPoint.timestamp_micro < running_timestamp_micro_cutoff,
-            )
-        ),
-        _execute_delete_statement(
-            delete(JobMetricsPoint).where(
-                JobMetricsPoint.job_id.in_(
-                    select(JobModel.id).where(JobModel.status.in_(JobStatus.finished_statuses()))
-                ),
-                JobMetricsPoint.timestamp_micro < finished_timestamp_micro_cutoff,
-            )
-        ),
+    finished_job_ids = select(JobModel.id).where(
+        JobModel.status.in_(JobStatus.finished_statuses())
+    )
+    await _rollup_metrics(now_timestamp_micro)
+    await _execute_delete_statement(
+        delete(JobMetricsPoint).where(
+            JobMetricsPoint.job_id.in_(finished_job_ids),
+            JobMetricsPoint.timestamp_micro < finished_timestamp_micro_cutoff,
+        )
+    )
+    await _execute_delete_statement(
+        delete(JobMetricsRollup).where(
+            JobMetricsRollup.job_id.in_(finished_job_ids),
+            JobMetricsRollup.timestamp_micro < finished_timestamp_micro_cutoff,
+        )
     )
 
 
-async def _execute_delete_statement(stmt: Delete) -> None:
+async def _rollup_metrics(now_timestamp_micro: int) -> None:
+    """
+    Rolls up metrics of running jobs that are older than the tier retention instead of
+    deleting them.
+    """
     async with get_session_ctx() as session:
-        await session.execute(stmt)
-        await session.commit()
+        res = await session.execute(
+            select(JobModel.id).where(JobModel.status.in_([JobStatus.RUNNING]))
+        )
+        job_ids = list(res.scalars().all())
+    points_cutoff = align_timestamp_micro(
+        now_timestamp_micro - settings.SERVER_METRICS_RUNNING_TTL_SECONDS * 1_000_000,
+        ROLLUP_RESOLUTIONS_SECONDS[0],
+    )
+    for i in range(0, len(job_ids), ROLLUP_BATCH_SIZE):
+        batch = job_ids[i : i + ROLLUP_BATCH_SIZE]
+        async with get_session_ctx() as session:
+            await rollup_job_metrics_points(session, batch, points_cutoff)
+        for resolution_seconds, target_resolution_seconds in zip(
+            ROLLUP_RESOLUTIONS_SECONDS, ROLLUP_RESOLUTIONS_SECONDS[1:]
+        ):
+            cutoff = align_timestamp_micro(
+                now_timestamp_micro - ROLLUP_RETENTION_SECONDS[resolution_seconds] * 1_000_000,
+                target_resolution_seconds,
+            )
+            async with get_session_ctx() as session:
+                await rollup_job_metrics_rollups(
+                    session, batch, resolution_seconds, target_resolution_seconds, cutoff
+                )
 
 
-async def _collect_jobs_metrics(job_models: List[JobModel]):
-    filtered_job_models = await _filter_recently_collected_jobs(job_models)
-    tasks = []
-    for job_model in filtered_job_models:
-        tasks.append(_collect_job_metrics(job_model))
-    points = await asyncio.gather(*tasks)
+async def _execute_delete_statement(stmt: Delete) -> None:
     async with get_session_ctx() as session:
-        for point in points:
-            if point is not None:
-                session.add(point)
+        await session.execute(stmt)
         await session.commit()
 
 
@@ -102,13 +200,11 @@ async def _filter_recently_collected_jobs(job_models: List[JobModel]) -> List[Jo
     # we'll just store some extra metric points in the db.
     async with get_session_ctx() as session:
         res = await session.execute(
-            select(JobMetricsPoint).where(
-                JobMetricsPoint.job_id.in_([j.id for j in job_models]),
-                JobMetricsPoint.timestamp_micro > _get_recently_collected_metric_cutoff(),
-            )
+            select(JobMetricsPoint.job_id)
+            .where(JobMetricsPoint.timestamp_micro > _get_recently_collected_metric_cutoff())
+            .distinct()
         )
-        recent_points = res.scalars().all()
-        recent_job_ids = [p.job_id for p in recent_points]
+        recent_job_ids = set(res.scalars().all())
     return [j for j in job_models if j.id not in recent_job_ids]
 
 
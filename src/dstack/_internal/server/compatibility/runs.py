@@ -25,6 +25,8 @@ def patch_run_plan(run_plan: RunPlan, client_version: Optional[Version]) -> None
 def patch_run(run: Run, client_version: Optional[Version]) -> None:
     if client_version is None:
         return
+    # `run.run_spec` may be shared via the parse cache.
+    run.run_spec = run.run_spec.model_copy(deep=True)
     patch_run_spec(run.run_spec, client_version)
 
 
@@ -1210,6 +1210,37 @@ class JobMetricsPoint(BaseModel):
     """`gpus_util_percent` stores a JSON-encoded list of metric values with length `len(gpus)`."""
 
 
+class JobMetricsRollup(BaseModel):
+    """
+    Aggregates of `JobMetricsPoint` over `resolution_seconds`-long buckets. Points of running jobs
+    are rolled up into rollups instead of being deleted, and finer rollups into coarser ones.
+    """
+
+    __tablename__ = "job_metrics_rollups"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUIDType(binary=False), primary_key=True, default=uuid.uuid4
+    )
+
+    job_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("jobs.id"))
+    job: Mapped["JobModel"] = relationship()
+
+    resolution_seconds: Mapped[int] = mapped_column(Integer)
+    timestamp_micro: Mapped[int] = mapped_column(BigInteger)
+    """`timestamp_micro` is the start of the bucket."""
+    aggregates: Mapped[str] = mapped_column(Text)
+    """`aggregates` stores a JSON-encoded `JobMetricsAggregates`."""
+
+    __table_args__ = (
+        Index(
+            "ix_job_metrics_rollups_job_id_resolution_seconds_timestamp_micro",
+            job_id,
+            resolution_seconds,
+            timestamp_micro,
+        ),
+    )
+
+
 class JobPrometheusMetrics(BaseModel):
     __tablename__ = "job_prometheus_metrics"
 
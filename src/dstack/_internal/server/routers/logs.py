@@ -1,10 +1,11 @@
 from typing import Tuple
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from dstack._internal.core.models.logs import JobSubmissionLogs
 from dstack._internal.server.models import ProjectModel, UserModel
-from dstack._internal.server.schemas.logs import PollLogsRequest
+from dstack._internal.server.schemas.logs import PollLogsRequest, StreamLogsRequest
 from dstack._internal.server.security.permissions import ProjectMember
 from dstack._internal.server.services import logs
 from dstack._internal.server.utils.routers import (
@@ -33,3 +34,26 @@ async def poll_logs(
     # Otherwise, some logs with duplicated timestamps may be filtered out.
     # This limitation is imposed by cloud log services that support up to millisecond timestamp resolution.
     return CustomJSONResponse(await logs.poll_logs_async(project=project, request=body))
+
+
+@router.post(
+    "/stream",
+    summary="Stream logs",
+    response_class=StreamingResponse,
+)
+async def stream_logs(
+    body: StreamLogsRequest,
+    user_project: Tuple[UserModel, ProjectModel] = Depends(ProjectMember()),
+):
+    """
+    Streams job submission logs until the job is finished.
+    The response is newline-delimited JSON, each line is a `JobSubmissionLogs` object.
+    Objects without logs are sent periodically as heartbeats.
+    """
+    _, project = user_project
+
+    async def stream():
+        async for job_submission_logs in logs.stream_logs(project=project, request=body):
+            yield job_submission_logs.model_dump_json() + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
@@ -15,3 +15,10 @@ class PollLogsRequest(CoreModel):
     next_token: Optional[str] = None
     limit: int = Field(100, ge=0, le=1000)
     diagnose: bool = False
+
+
+class StreamLogsRequest(CoreModel):
+    run_name: str
+    job_submission_id: UUID4
+    start_time: Optional[datetime] = None
+    diagnose: bool = False
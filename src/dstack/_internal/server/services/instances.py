@@ -60,6 +60,7 @@ from dstack._internal.server.schemas.runner import InstanceHealthResponse, TaskS
 from dstack._internal.server.services import events
 from dstack._internal.server.services.logging import fmt
 from dstack._internal.server.services.offers import generate_shared_offer
+from dstack._internal.server.services.parse_cache import parse_cache
 from dstack._internal.server.services.projects import list_user_project_models
 from dstack._internal.server.services.runner.client import ShimClient
 from dstack._internal.utils import common as common_utils
@@ -310,14 +311,16 @@ def get_instance_health_response(
 def get_instance_provisioning_data(instance_model: InstanceModel) -> Optional[JobProvisioningData]:
     if instance_model.job_provisioning_data is None:
         return None
-    return validate_json_extra_ignore(JobProvisioningData, instance_model.job_provisioning_data)
+    return parse_cache.parse(
+        JobProvisioningData, instance_model.id, instance_model.job_provisioning_data
+    )
 
 
 def get_instance_offer(instance_model: InstanceModel) -> Optional[InstanceOfferWithAvailability]:
     if instance_model.offer is None:
         return None
-    return validate_json_extra_ignore(
-        InstanceOfferWithAvailability, get_or_error(instance_model.offer)
+    return parse_cache.parse(
+        InstanceOfferWithAvailability, instance_model.id, get_or_error(instance_model.offer)
     )
 
 
@@ -55,6 +55,7 @@ from dstack._internal.server.services.jobs.configurators.dev import DevEnvironme
 from dstack._internal.server.services.jobs.configurators.service import ServiceJobConfigurator
 from dstack._internal.server.services.jobs.configurators.task import TaskJobConfigurator
 from dstack._internal.server.services.logging import fmt
+from dstack._internal.server.services.parse_cache import parse_cache
 from dstack._internal.server.services.probes import probe_model_to_probe
 from dstack._internal.server.services.runner import client
 from dstack._internal.server.services.runner.ssh import runner_ssh_tunnel
@@ -243,7 +244,9 @@ def job_model_to_job_submission(
             and job_provisioning_data.backend_data is not None
         ):
             backend_data = json.loads(job_provisioning_data.backend_data)
-            job_provisioning_data.backend = backend_data["base_backend"]
+            job_provisioning_data = job_provisioning_data.model_copy(
+                update={"backend": backend_data["base_backend"]}
+            )
     last_processed_at = job_model.last_processed_at
     finished_at = None
     if job_model.status.is_finished():
@@ -279,13 +282,13 @@ def job_model_to_job_submission(
 def get_job_provisioning_data(job_model: JobModel) -> Optional[JobProvisioningData]:
     if job_model.job_provisioning_data is None:
         return None
-    return validate_json_extra_ignore(JobProvisioningData, job_model.job_provisioning_data)
+    return parse_cache.parse(JobProvisioningData, job_model.id, job_model.job_provisioning_data)
 
 
 def get_job_runtime_data(job_model: JobModel) -> Optional[JobRuntimeData]:
     if job_model.job_runtime_data is None:
         return None
-    return validate_json_extra_ignore(JobRuntimeData, job_model.job_runtime_data)
+    return parse_cache.parse(JobRuntimeData, job_model.id, job_model.job_runtime_data)
 
 
 def _get_image_pull_progress(job_model: JobModel) -> Optional[ImagePullProgress]:
@@ -295,7 +298,7 @@ def _get_image_pull_progress(job_model: JobModel) -> Optional[ImagePullProgress]
 
 
 def get_job_spec(job_model: JobModel) -> JobSpec:
-    return validate_json_extra_ignore(JobSpec, job_model.job_spec_data)
+    return parse_cache.parse(JobSpec, job_model.id, job_model.job_spec_data)
 
 
 def job_spec_updatable_in_place(old_job_spec: JobSpec, new_job_spec: JobSpec) -> bool:
@@ -1,12 +1,16 @@
+import asyncio
 import atexit
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
 from uuid import UUID
 
+from sqlalchemy import select
+
 from dstack._internal.core.errors import ServerClientError
-from dstack._internal.core.models.logs import JobSubmissionLogs
+from dstack._internal.core.models.logs import JobSubmissionLogs, LogProducer
 from dstack._internal.server import settings
-from dstack._internal.server.models import ProjectModel
-from dstack._internal.server.schemas.logs import PollLogsRequest
+from dstack._internal.server.db import get_session_ctx
+from dstack._internal.server.models import JobModel, ProjectModel
+from dstack._internal.server.schemas.logs import PollLogsRequest, StreamLogsRequest
 from dstack._internal.server.schemas.runner import LogEvent as RunnerLogEvent
 from dstack._internal.server.services.logs import aws as aws_logs
 from dstack._internal.server.services.logs import fluentbit as fluentbit_logs
@@ -16,12 +20,20 @@ from dstack._internal.server.services.logs.base import (
     LogStorageError,
     b64encode_raw_message,
 )
+from dstack._internal.server.services.logs.buffered import BufferedLogStorage
+from dstack._internal.server.services.logs.fanout import get_log_fanout
 from dstack._internal.server.services.logs.filelog import FileLogStorage
 from dstack._internal.utils.common import run_async
 from dstack._internal.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# How often a log stream without new events re-polls the log storage and checks the job status.
+# Re-polling also delivers logs written by other server replicas.
+_STREAM_RESYNC_INTERVAL = 5
+# Page size when catching up from the log storage.
+_STREAM_PAGE_LIMIT = 1000
+
 
 _log_storage: Optional[LogStorage] = None
 
@@ -85,6 +97,14 @@ def get_log_storage() -> LogStorage:
     if _log_storage is None:
         _log_storage = FileLogStorage()
         logger.debug("Using file-based storage")
+    elif settings.SERVER_LOG_BUFFER_FLUSH_INTERVAL > 0:
+        # Remote storages are written to in bulk off the job processing path.
+        # File-based storage is not buffered as writes are cheap and logs are read right away.
+        _log_storage = BufferedLogStorage(
+            _log_storage,
+            flush_interval=settings.SERVER_LOG_BUFFER_FLUSH_INTERVAL,
+            max_size=settings.SERVER_LOG_BUFFER_MAX_SIZE,
+        )
     atexit.register(_log_storage.close)
     return _log_storage
 
@@ -96,13 +116,23 @@ def write_logs(
     runner_logs: List[RunnerLogEvent],
     job_logs: List[RunnerLogEvent],
 ) -> None:
-    return get_log_storage().write_logs(
+    get_log_storage().write_logs(
         project=project,
         run_name=run_name,
         job_submission_id=job_submission_id,
         runner_logs=runner_logs,
         job_logs=job_logs,
     )
+    get_log_fanout().publish(
+        job_submission_id=job_submission_id,
+        runner_logs=runner_logs,
+        job_logs=job_logs,
+    )
+
+
+def flush_logs() -> None:
+    if _log_storage is not None:
+        _log_storage.flush()
 
 
 async def poll_logs_async(project: ProjectModel, request: PollLogsRequest) -> JobSubmissionLogs:
@@ -120,3 +150,82 @@ async def poll_logs_async(project: ProjectModel, request: PollLogsRequest) -> Jo
     for log_event in job_submission_logs.logs:
         log_event.message = b64encode_raw_message(log_event.message.encode())
     return job_submission_logs
+
+
+async def stream_logs(
+    project: ProjectModel, request: StreamLogsRequest
+) -> AsyncGenerator[JobSubmissionLogs, None]:
+    """
+    Yields batches of job submission logs as they are written until the job is finished.
+    Existing logs are read from the log storage first, new logs are received from
+    the in-process fan-out, so followers do not poll the storage on every update.
+    """
+    producer = LogProducer.RUNNER if request.diagnose else LogProducer.JOB
+    start_time = request.start_time
+    with get_log_fanout().subscribe(request.job_submission_id, producer) as subscription:
+        while True:
+            # The status is checked before the catch-up so that logs written
+            # before the job finished are not missed.
+            job_finished = await _is_job_finished(project, request.job_submission_id)
+            # Catch up from the log storage. Events received by the subscription
+            # before or during the catch-up are deduplicated by timestamp.
+            subscription.reset()
+            # `start_time` must not change while paging with `next_token`,
+            # otherwise events sharing the timestamp of the last event on a page are skipped.
+            last_timestamp = start_time
+            next_token = None
+            while True:
+                job_submission_logs = await poll_logs_async(
+                    project=project,
+                    request=PollLogsRequest(
+                        run_name=request.run_name,
+                        job_submission_id=request.job_submission_id,
+                        start_time=start_time,
+                        next_token=next_token,
+                        limit=_STREAM_PAGE_LIMIT,
+                        diagnose=request.diagnose,
+                    ),
+                )
+                if len(job_submission_logs.logs) > 0:
+                    last_timestamp = job_submission_logs.logs[-1].timestamp
+                    yield JobSubmissionLogs(logs=job_submission_logs.logs)
+                next_token = job_submission_logs.next_token
+                if next_token is None:
+                    break
+            start_time = last_timestamp
+            if job_finished:
+                return
+            while not subscription.overflowed:
+                try:
+                    events = await asyncio.wait_for(
+                        subscription.get(), timeout=_STREAM_RESYNC_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    # An empty batch as a heartbeat so that idle streams
+                    # are not closed by proxies on read timeouts.
+                    yield JobSubmissionLogs(logs=[])
+                    break
+                logs = [e for e in events if start_time is None or e.timestamp > start_time]
+                if len(logs) == 0:
+                    continue
+                start_time = logs[-1].timestamp
+                # Events are shared between subscribers, encode copies.
+                # See `poll_logs_async()` on base64 encoding.
+                yield JobSubmissionLogs(
+                    logs=[
+                        e.model_copy(update={"message": b64encode_raw_message(e.message.encode())})
+                        for e in logs
+                    ]
+                )
+
+
+async def _is_job_finished(project: ProjectModel, job_submission_id: UUID) -> bool:
+    async with get_session_ctx() as session:
+        res = await session.execute(
+            select(JobModel.status).where(
+                JobModel.id == job_submission_id,
+                JobModel.project_id == project.id,
+            )
+        )
+        status = res.scalar_one_or_none()
+    return status is None or status.is_finished()
@@ -1,7 +1,8 @@
 import base64
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from dstack._internal.core.errors import DstackError
@@ -15,6 +16,26 @@ class LogStorageError(DstackError):
     pass
 
 
+@dataclass
+class LogWrite:
+    project: ProjectModel
+    run_name: str
+    job_submission_id: UUID
+    runner_logs: List[RunnerLogEvent] = field(default_factory=list)
+    job_logs: List[RunnerLogEvent] = field(default_factory=list)
+
+
+class LogWritesError(LogStorageError):
+    """
+    Raised by `LogStorage.write_logs_many()` when only some of the writes failed
+    so that the others are not written again.
+    """
+
+    def __init__(self, failed_writes: List[LogWrite], error: Exception) -> None:
+        super().__init__(f"{len(failed_writes)} log write(s) failed: {error!r}")
+        self.failed_writes = failed_writes
+
+
 class LogStorage(ABC):
     @abstractmethod
     def poll_logs(self, project: ProjectModel, request: PollLogsRequest) -> JobSubmissionLogs:
@@ -31,6 +52,31 @@ class LogStorage(ABC):
     ) -> None:
         pass
 
+    def write_logs_many(self, writes: List[LogWrite]) -> None:
+        """
+        Writes logs of multiple job submissions. Storages that support
+        writing to multiple streams in one request should override it.
+        """
+        failed_writes: List[LogWrite] = []
+        error: Optional[Exception] = None
+        for write in writes:
+            try:
+                self.write_logs(
+                    project=write.project,
+                    run_name=write.run_name,
+                    job_submission_id=write.job_submission_id,
+                    runner_logs=write.runner_logs,
+                    job_logs=write.job_logs,
+                )
+            except Exception as e:
+                failed_writes.append(write)
+                error = e
+        if error is not None:
+            raise LogWritesError(failed_writes, error)
+
+    def flush(self) -> None:
+        pass
+
     def close(self) -> None:
         pass
 
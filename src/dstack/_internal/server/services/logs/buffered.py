@@ -0,0 +1,174 @@
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from dstack._internal.core.models.logs import JobSubmissionLogs
+from dstack._internal.server.models import ProjectModel
+from dstack._internal.server.schemas.logs import PollLogsRequest
+from dstack._internal.server.schemas.runner import LogEvent as RunnerLogEvent
+from dstack._internal.server.services.logs.base import LogStorage, LogWrite, LogWritesError
+from dstack._internal.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class BufferedLogStorage(LogStorage):
+    """
+    A write-behind buffer in front of another log storage. Logs are accumulated per job
+    submission and written by a background thread in bulk when the buffer is half full
+    or `flush_interval` seconds passed. `write_logs()` blocks while the buffer is full.
+
+    Unlike unbuffered writes, a write failure is not propagated to the caller, so the runner
+    logs are not pulled again. Failed writes are retried on subsequent flushes and dropped after
+    `MAX_WRITE_ATTEMPTS`. Logs buffered at the time of a server crash are lost.
+    """
+
+    # How many times a failed write is retried on subsequent flushes before logs are dropped.
+    MAX_WRITE_ATTEMPTS = 3
+
+    def __init__(self, storage: LogStorage, *, flush_interval: float, max_size: int) -> None:
+        self._storage = storage
+        self._flush_interval = flush_interval
+        self._max_size = max_size
+        self._cond = threading.Condition()
+        # Flushes must not run concurrently so that logs of a job are written in order.
+        self._flush_lock = threading.Lock()
+        self._buffer: Dict[Tuple[str, str, UUID], LogWrite] = {}
+        self._attempts: Dict[Tuple[str, str, UUID], int] = {}
+        self._size = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def poll_logs(self, project: ProjectModel, request: PollLogsRequest) -> JobSubmissionLogs:
+        return self._storage.poll_logs(project=project, request=request)
+
+    def write_logs(
+        self,
+        project: ProjectModel,
+        run_name: str,
+        job_submission_id: UUID,
+        runner_logs: List[RunnerLogEvent],
+        job_logs: List[RunnerLogEvent],
+    ) -> None:
+        if len(runner_logs) == 0 and len(job_logs) == 0:
+            return
+        size = _get_size(runner_logs) + _get_size(job_logs)
+        with self._cond:
+            if self._size >= self._max_size and not self._closed:
+                logger.debug("Log buffer is full, waiting for flush")
+                self._cond.notify_all()
+                self._cond.wait_for(lambda: self._size < self._max_size or self._closed)
+            if not self._closed:
+                key = _get_key_for(project, run_name, job_submission_id)
+                write = self._buffer.get(key)
+                if write is None:
+                    write = LogWrite(
+                        project=project, run_name=run_name, job_submission_id=job_submission_id
+                    )
+                    self._buffer[key] = write
+                write.runner_logs.extend(runner_logs)
+                write.job_logs.extend(job_logs)
+                self._size += size
+                if self._size >= self._max_size // 2:
+                    self._cond.notify_all()
+                return
+        # Closed on shutdown, write through
+        self._storage.write_logs(
+            project=project,
+            run_name=run_name,
+            job_submission_id=job_submission_id,
+            runner_logs=runner_logs,
+            job_logs=job_logs,
+        )
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._cond:
+                buffer = self._buffer
+                self._buffer = {}
+            if len(buffer) == 0:
+                return
+            # The size is decreased only after writing so that writers wait for the flush.
+            size = sum(_get_size(w.runner_logs) + _get_size(w.job_logs) for w in buffer.values())
+            retry: Dict[Tuple[str, str, UUID], LogWrite] = {}
+            failed: Dict[Tuple[str, str, UUID], LogWrite] = {}
+            error: Optional[Exception] = None
+            try:
+                self._storage.write_logs_many(list(buffer.values()))
+            except LogWritesError as e:
+                failed = {_get_key(w): w for w in e.failed_writes}
+                error = e
+            except Exception as e:
+                failed = buffer
+                error = e
+            for key in buffer:
+                if key not in failed:
+                    self._attempts.pop(key, None)
+            for key, write in failed.items():
+                attempts = self._attempts.get(key, 0) + 1
+                if attempts < self.MAX_WRITE_ATTEMPTS:
+                    self._attempts[key] = attempts
+                    retry[key] = write
+                else:
+                    self._attempts.pop(key, None)
+                    logger.error(
+                        "Dropping logs of job submission %s after %d failed writes: %r",
+                        key[2],
+                        attempts,
+                        error,
+                    )
+            with self._cond:
+                for key, write in retry.items():
+                    size -= _get_size(write.runner_logs) + _get_size(write.job_logs)
+                    # Retried logs go before logs buffered during the flush
+                    newer = self._buffer.pop(key, None)
+                    if newer is not None:
+                        write.runner_logs.extend(newer.runner_logs)
+                        write.job_logs.extend(newer.job_logs)
+                    self._buffer[key] = write
+                self._size -= size
+                self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self.flush()
+        self._storage.close()
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + self._flush_interval
+        while True:
+            with self._cond:
+                # Failed writes are retried on schedule, not as soon as the buffer fills up
+                self._cond.wait_for(
+                    lambda: (
+                        self._closed
+                        or (self._size >= self._max_size // 2 and len(self._attempts) == 0)
+                    ),
+                    timeout=max(deadline - time.monotonic(), 0),
+                )
+                if self._closed:
+                    return
+            deadline = time.monotonic() + self._flush_interval
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Unexpected error when flushing logs")
+
+
+def _get_size(log_events: List[RunnerLogEvent]) -> int:
+    return sum(len(e.message) for e in log_events)
+
+
+def _get_key(write: LogWrite) -> Tuple[str, str, UUID]:
+    return _get_key_for(write.project, write.run_name, write.job_submission_id)
+
+
+def _get_key_for(
+    project: ProjectModel, run_name: str, job_submission_id: UUID
+) -> Tuple[str, str, UUID]:
+    return (project.name, run_name, job_submission_id)
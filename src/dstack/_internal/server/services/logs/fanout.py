@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from typing import Dict, List, Set, Tuple
+from uuid import UUID
+
+from dstack._internal.core.models.logs import LogEvent, LogEventSource, LogProducer
+from dstack._internal.server.schemas.runner import LogEvent as RunnerLogEvent
+from dstack._internal.server.services.logs.base import unix_time_ms_to_datetime
+
+# Max number of pending batches per subscriber. A subscriber that falls behind is marked
+# as overflowed and is expected to catch up from the log storage.
+_SUBSCRIPTION_QUEUE_SIZE = 100
+
+
+class LogSubscription:
+    """
+    Receives log events written for one job submission and producer.
+    Must be created and consumed in the event loop.
+    """
+
+    def __init__(self, fanout: "LogFanout", key: Tuple[UUID, LogProducer]) -> None:
+        self._fanout = fanout
+        self._key = key
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[List[LogEvent]] = asyncio.Queue(_SUBSCRIPTION_QUEUE_SIZE)
+        self.overflowed = False
+
+    async def get(self) -> List[LogEvent]:
+        return await self._queue.get()
+
+    def reset(self) -> None:
+        """
+        Drops pending events and clears the overflow flag,
+        to be called before catching up from the log storage.
+        """
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self.overflowed = False
+
+    def close(self) -> None:
+        self._fanout._unsubscribe(self._key, self)
+
+    def __enter__(self) -> "LogSubscription":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _put(self, events: List[LogEvent]) -> None:
+        try:
+            self._queue.put_nowait(events)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    def _put_threadsafe(self, events: List[LogEvent]) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._put, events)
+        except RuntimeError:
+            # The loop is closed
+            pass
+
+
+class LogFanout:
+    """
+    An in-process fan-out of freshly written job logs to log stream subscribers.
+    Publishing is thread-safe since logs are written from worker threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[Tuple[UUID, LogProducer], Set[LogSubscription]] = {}
+
+    def subscribe(self, job_submission_id: UUID, producer: LogProducer) -> LogSubscription:
+        key = (job_submission_id, producer)
+        subscription = LogSubscription(self, key)
+        with self._lock:
+            self._subscriptions.setdefault(key, set()).add(subscription)
+        return subscription
+
+    def publish(
+        self,
+        job_submission_id: UUID,
+        runner_logs: List[RunnerLogEvent],
+        job_logs: List[RunnerLogEvent],
+    ) -> None:
+        for producer, runner_log_events in [
+            (LogProducer.RUNNER, runner_logs),
+            (LogProducer.JOB, job_logs),
+        ]:
+            if len(runner_log_events) == 0:
+                continue
+            with self._lock:
+                subscriptions = list(self._subscriptions.get((job_submission_id, producer), ()))
+            if len(subscriptions) == 0:
+                continue
+            events = [_runner_log_event_to_log_event(e) for e in runner_log_events]
+            for subscription in subscriptions:
+                subscription._put_threadsafe(events)
+
+    def _unsubscribe(self, key: Tuple[UUID, LogProducer], subscription: LogSubscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(key)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if len(subscriptions) == 0:
+                del self._subscriptions[key]
+
+
+_log_fanout = LogFanout()
+
+
+def get_log_fanout() -> LogFanout:
+    return _log_fanout
+
+
+def _runner_log_event_to_log_event(runner_log_event: RunnerLogEvent) -> LogEvent:
+    return LogEvent(
+        timestamp=unix_time_ms_to_datetime(runner_log_event.timestamp),
+        log_source=LogEventSource.STDOUT,
+        message=runner_log_event.message.decode(errors="replace"),
+    )
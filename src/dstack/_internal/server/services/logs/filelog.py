@@ -1,10 +1,15 @@
+import gzip
+import io
 import os
+import struct
+from bisect import bisect_right
+from datetime import datetime
 from pathlib import Path
-from typing import Generator, List, Optional, Tuple, Union
+from typing import BinaryIO, Generator, List, NamedTuple, Optional, Tuple, Union
 from uuid import UUID
 
 from dstack._internal.core.errors import ServerClientError
-from dstack._internal.core.models.common import validate_json_extra_ignore
+from dstack._internal.core.models.common import CoreModel, validate_json_extra_ignore
 from dstack._internal.core.models.logs import (
     JobSubmissionLogs,
     LogEvent,
@@ -17,18 +22,125 @@ from dstack._internal.server.schemas.logs import PollLogsRequest
 from dstack._internal.server.schemas.runner import LogEvent as RunnerLogEvent
 from dstack._internal.server.services.logs.base import (
     LogStorage,
+    datetime_to_unix_time_ms,
     unix_time_ms_to_datetime,
 )
 
+# Ascending `next_token`s are byte offsets prefixed with `_OFFSET_TOKEN_PREFIX`.
+# Plain integer tokens are line numbers issued by older server versions and are still accepted.
+_OFFSET_TOKEN_PREFIX = "b"
+
+# Each log file has a sparse sidecar index – a sequence of fixed-size records,
+# one per block of at least `_INDEX_BLOCK_SIZE` bytes of log lines.
+_INDEX_RECORD = struct.Struct("<QQQq")
+_INDEX_BLOCK_SIZE = 64 * 1024
+
+# Sealed segments are compressed as a sequence of independent gzip members of at least
+# `_GZIP_MEMBER_SIZE` uncompressed bytes, so that reading a page decompresses only a few members.
+_GZIP_MEMBER_SIZE = 256 * 1024
+
+
+class _IndexEntry(NamedTuple):
+    first_line: int
+    line_count: int
+    offset: int
+    first_timestamp: int  # unix time in ms
+
+
+class _LogIndex:
+    """
+    A read-only view of the sidecar index that reads records on demand,
+    so that lookups are done with a binary search over the file without loading it.
+    """
+
+    def __init__(self, f: BinaryIO, size: int) -> None:
+        self._f = f
+        self._len = size // _INDEX_RECORD.size
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> _IndexEntry:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError(i)
+        self._f.seek(i * _INDEX_RECORD.size)
+        return _IndexEntry._make(_INDEX_RECORD.unpack(self._f.read(_INDEX_RECORD.size)))
+
+    def find_line(self, line: int) -> Optional[_IndexEntry]:
+        """
+        Returns the entry of the block containing `line` or the closest preceding block.
+        """
+        i = bisect_right(self, line, key=lambda e: e.first_line) - 1
+        if i < 0:
+            return None
+        return self[i]
+
+    def find_timestamp(self, timestamp: int) -> int:
+        """
+        Returns the number of leading blocks with `first_timestamp <= timestamp`.
+        """
+        return bisect_right(self, timestamp, key=lambda e: e.first_timestamp)
+
+
+class _GzipMember(CoreModel):
+    offset: int  # uncompressed offset within the segment
+    compressed_offset: int
+
+
+class _SealedSegment(CoreModel):
+    number: int
+    offset: int
+    size: int
+    first_timestamp: int  # unix time in ms
+    last_timestamp: int  # unix time in ms
+    # Members start at line boundaries. Empty for segments compressed as a single member.
+    members: List[_GzipMember] = []
+
+    def get_members(self) -> List[_GzipMember]:
+        if not self.members:
+            return [_GzipMember(offset=0, compressed_offset=0)]
+        return self.members
+
+
+class _SegmentManifest(CoreModel):
+    """
+    Describes the segments of a log. A log is a sequence of sealed gzip-compressed segments
+    followed by one plain active segment that is appended to. Offsets in tokens and the index
+    are logical – they address the uncompressed concatenation of all segments.
+    """
+
+    sealed: List[_SealedSegment] = []
+    active: int = 0
+
+
+class _Segment(NamedTuple):
+    path: Path
+    offset: int
+    size: int
+    sealed: Optional[_SealedSegment]
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.size
+
 
 class FileLogStorage(LogStorage):
     root: Path
 
-    def __init__(self, root: Union[Path, str, None] = None) -> None:
+    def __init__(
+        self,
+        root: Union[Path, str, None] = None,
+        segment_size: Optional[int] = None,
+    ) -> None:
         if root is None:
             self.root = settings.SERVER_DIR_PATH
         else:
             self.root = Path(root)
+        if segment_size is None:
+            segment_size = settings.SERVER_FILE_LOG_SEGMENT_SIZE
+        self.segment_size = segment_size
 
     def poll_logs(self, project: ProjectModel, request: PollLogsRequest) -> JobSubmissionLogs:
         log_producer = LogProducer.RUNNER if request.diagnose else LogProducer.JOB
@@ -47,51 +159,47 @@ class FileLogStorage(LogStorage):
     def _poll_logs_ascending(
         self, log_file_path: Path, request: PollLogsRequest
     ) -> JobSubmissionLogs:
-        start_line = 0
+        offset, start_line = 0, None
         if request.next_token:
-            start_line = self._parse_next_token(request.next_token)
+            offset, start_line = self._parse_ascending_next_token(request.next_token)
 
         logs = []
         next_token = None
-        current_line = 0
 
-        try:
-            with open(log_file_path) as f:
-                # Skip to start_line if needed
-                for _ in range(start_line):
-                    if f.readline() == "":
-                        # File is shorter than start_line
-                        return JobSubmissionLogs(logs=logs, next_token=next_token)
-                    current_line += 1
-
-                # Read lines one by one
-                while True:
-                    line = f.readline()
-                    if line == "":  # EOF
-                        break
-
-                    current_line += 1
-
-                    try:
-                        log_event = validate_json_extra_ignore(LogEvent, line)
-                    except Exception:
-                        # Skip malformed lines
-                        continue
-
-                    if request.start_time and log_event.timestamp <= request.start_time:
-                        continue
-                    if request.end_time is not None and log_event.timestamp >= request.end_time:
-                        break
-
-                    logs.append(log_event)
-
-                    if len(logs) >= request.limit:
-                        # Check if there are more lines to read
-                        if f.readline() != "":
-                            next_token = str(current_line)
-                        break
-        except FileNotFoundError:
-            pass
+        segments = self._get_segments(log_file_path)
+        if not segments:
+            return JobSubmissionLogs(logs=logs, next_token=next_token)
+        if start_line is not None:
+            line_offset = self._find_line_offset(log_file_path, segments, start_line)
+            if line_offset is None:
+                # File is shorter than start_line
+                return JobSubmissionLogs(logs=logs, next_token=next_token)
+            offset = line_offset
+        elif not request.next_token and request.start_time:
+            offset = self._find_start_offset(log_file_path, segments, request.start_time)
+
+        # Read lines one by one
+        line_generator = self._read_lines(log_file_path, segments, offset)
+        for line, line_end_offset in line_generator:
+            try:
+                log_event = validate_json_extra_ignore(LogEvent, line.decode("utf-8"))
+            except Exception:
+                # Skip malformed lines
+                continue
+
+            if request.start_time and log_event.timestamp <= request.start_time:
+                continue
+            if request.end_time is not None and log_event.timestamp >= request.end_time:
+                break
+
+            logs.append(log_event)
+
+            if len(logs) >= request.limit:
+                # Check if there are more lines to read
+                if next(line_generator, None) is not None:
+                    next_token = f"{_OFFSET_TOKEN_PREFIX}{line_end_offset}"
+                break
+        line_generator.close()
 
         return JobSubmissionLogs(logs=logs, next_token=next_token)
 
@@ -102,29 +210,32 @@ class FileLogStorage(LogStorage):
         if request.next_token is not None:
             start_offset = self._parse_next_token(request.next_token)
 
+        segments = self._get_segments(log_file_path)
+        if not segments:
+            return JobSubmissionLogs(logs=[], next_token=None)
+        if request.next_token is None and request.end_time is not None:
+            start_offset = self._find_end_offset(log_file_path, segments, request.end_time)
+
         candidate_logs = []
 
-        try:
-            line_generator = self._read_lines_reversed(log_file_path, start_offset)
+        line_generator = self._read_segment_lines_reversed(log_file_path, segments, start_offset)
+        for line_bytes, line_start_offset in line_generator:
+            try:
+                line_str = line_bytes.decode("utf-8")
+                log_event = validate_json_extra_ignore(LogEvent, line_str)
+            except Exception:
+                continue  # Skip malformed lines
 
-            for line_bytes, line_start_offset in line_generator:
-                try:
-                    line_str = line_bytes.decode("utf-8")
-                    log_event = validate_json_extra_ignore(LogEvent, line_str)
-                except Exception:
-                    continue  # Skip malformed lines
+            if request.end_time is not None and log_event.timestamp > request.end_time:
+                continue
+            if request.start_time and log_event.timestamp <= request.start_time:
+                break
 
-                if request.end_time is not None and log_event.timestamp > request.end_time:
-                    continue
-                if request.start_time and log_event.timestamp <= request.start_time:
-                    break
-
-                candidate_logs.append((log_event, line_start_offset))
+            candidate_logs.append((log_event, line_start_offset))
 
-                if len(candidate_logs) > request.limit:
-                    break
-        except FileNotFoundError:
-            return JobSubmissionLogs(logs=[], next_token=None)
+            if len(candidate_logs) > request.limit:
+                break
+        line_generator.close()
 
         logs = [log for log, _ in candidate_logs[: request.limit]]
         next_token = None
@@ -136,62 +247,143 @@ class FileLogStorage(LogStorage):
 
         return JobSubmissionLogs(logs=logs, next_token=next_token)
 
+    def _read_lines(
+        self, log_file_path: Path, segments: List[_Segment], offset: int
+    ) -> Generator[Tuple[bytes, int], None, None]:
+        """
+        A generator that yields complete lines starting at the logical `offset`, along with
+        the logical offset of the end of each line. Sealed segments before `offset`
+        are not decompressed.
+        """
+        for segment in segments:
+            if segment.sealed is not None and segment.end <= offset:
+                continue
+            segment, f = self._open_segment(log_file_path, segment)
+            if f is None:
+                continue
+            with f:
+                segment_offset = max(offset - segment.offset, 0)
+                lines_file: BinaryIO = f
+                if segment.sealed is not None:
+                    members = segment.sealed.get_members()
+                    member = members[bisect_right([m.offset for m in members], segment_offset) - 1]
+                    f.seek(member.compressed_offset)
+                    lines_file = gzip.GzipFile(fileobj=f, mode="rb")  # type: ignore[assignment]
+                    lines_file.seek(segment_offset - member.offset)
+                else:
+                    f.seek(segment_offset)
+                line_end_offset = segment.offset + segment_offset
+                for line in lines_file:
+                    if not line.endswith(b"\n"):
+                        # A line that is still being written
+                        return
+                    line_end_offset += len(line)
+                    yield line, line_end_offset
+
+    def _read_segment_lines_reversed(
+        self, log_file_path: Path, segments: List[_Segment], start_offset: Optional[int] = None
+    ) -> Generator[Tuple[bytes, int], None, None]:
+        """
+        A generator that yields lines across segments in reverse order, along with the logical
+        offset of the start of each line. Only lines starting before `start_offset` are yielded.
+        """
+        for segment in reversed(segments):
+            if start_offset is not None and segment.offset >= start_offset:
+                continue
+            segment, f = self._open_segment(log_file_path, segment)
+            if f is None:
+                continue
+            segment_start_offset = None
+            if start_offset is not None and start_offset < segment.end:
+                segment_start_offset = start_offset - segment.offset
+            with f:
+                if segment.sealed is None:
+                    for line, line_start_offset in self._read_file_lines_reversed(
+                        f, segment_start_offset
+                    ):
+                        yield line, segment.offset + line_start_offset
+                    continue
+                # gzip streams are not seekable backwards, decompress one member at a time
+                members = segment.sealed.get_members()
+                for i in reversed(range(len(members))):
+                    member = members[i]
+                    if segment_start_offset is not None and member.offset >= segment_start_offset:
+                        continue
+                    f.seek(member.compressed_offset)
+                    if i + 1 < len(members):
+                        data = f.read(members[i + 1].compressed_offset - member.compressed_offset)
+                    else:
+                        data = f.read()
+                    member_start_offset = None
+                    if segment_start_offset is not None:
+                        member_start_offset = segment_start_offset - member.offset
+                    for line, line_start_offset in self._read_file_lines_reversed(
+                        io.BytesIO(gzip.decompress(data)), member_start_offset
+                    ):
+                        yield line, segment.offset + member.offset + line_start_offset
+
     @staticmethod
     def _read_lines_reversed(
         filepath: Path, start_offset: Optional[int] = None, chunk_size: int = 8192
+    ) -> Generator[Tuple[bytes, int], None, None]:
+        with open(filepath, "rb") as f:
+            yield from FileLogStorage._read_file_lines_reversed(f, start_offset, chunk_size)
+
+    @staticmethod
+    def _read_file_lines_reversed(
+        f: BinaryIO, start_offset: Optional[int] = None, chunk_size: int = 8192
     ) -> Generator[Tuple[bytes, int], None, None]:
         """
         A generator that yields lines from a file in reverse order, along with the byte
         offset of the start of each line. This is memory-efficient for large files.
         """
-        with open(filepath, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            file_size = f.tell()
-            cursor = file_size
-
-            # If a start_offset is provided, optimize by starting the read
-            # from a more specific location instead of the end of the file.
-            if start_offset is not None and start_offset < file_size:
-                # To get the full content of the line that straddles the offset,
-                # we need to find its end (the next newline character).
-                f.seek(start_offset)
-                chunk = f.read(chunk_size)
-                newline_pos = chunk.find(b"\n")
-                if newline_pos != -1:
-                    # Found the end of the line. The cursor for reverse reading
-                    # should start from this point to include the full line.
-                    cursor = start_offset + newline_pos + 1
-                else:
-                    # No newline found, which means the rest of the file is one line.
-                    # The default cursor pointing to file_size is correct.
-                    pass
-
-            buffer = b""
-
-            while cursor > 0:
-                seek_pos = max(0, cursor - chunk_size)
-                amount_to_read = cursor - seek_pos
-                f.seek(seek_pos)
-                chunk = f.read(amount_to_read)
-                cursor = seek_pos
-
-                buffer = chunk + buffer
-
-                while b"\n" in buffer:
-                    newline_pos = buffer.rfind(b"\n")
-                    line = buffer[newline_pos + 1 :]
-                    line_start_offset = cursor + newline_pos + 1
-
-                    # Skip lines that start at or after the start_offset
-                    if start_offset is None or line_start_offset < start_offset:
-                        yield line, line_start_offset
-
-                    buffer = buffer[:newline_pos]
-
-            # The remaining buffer is the first line of the file.
-            # Only yield it if we're not using start_offset or if it starts before start_offset
-            if buffer and (start_offset is None or 0 < start_offset):
-                yield buffer, 0
+        f.seek(0, os.SEEK_END)
+        file_size = f.tell()
+        cursor = file_size
+
+        # If a start_offset is provided, optimize by starting the read
+        # from a more specific location instead of the end of the file.
+        if start_offset is not None and start_offset < file_size:
+            # To get the full content of the line that straddles the offset,
+            # we need to find its end (the next newline character).
+            f.seek(start_offset)
+            chunk = f.read(chunk_size)
+            newline_pos = chunk.find(b"\n")
+            if newline_pos != -1:
+                # Found the end of the line. The cursor for reverse reading
+                # should start from this point to include the full line.
+                cursor = start_offset + newline_pos + 1
+            else:
+                # No newline found, which means the rest of the file is one line.
+                # The default cursor pointing to file_size is correct.
+                pass
+
+        buffer = b""
+
+        while cursor > 0:
+            seek_pos = max(0, cursor - chunk_size)
+            amount_to_read = cursor - seek_pos
+            f.seek(seek_pos)
+            chunk = f.read(amount_to_read)
+            cursor = seek_pos
+
+            buffer = chunk + buffer
+
+            while b"\n" in buffer:
+                newline_pos = buffer.rfind(b"\n")
+                line = buffer[newline_pos + 1 :]
+                line_start_offset = cursor + newline_pos + 1
+
+                # Skip lines that start at or after the start_offset
+                if start_offset is None or line_start_offset < start_offset:
+                    yield line, line_start_offset
+
+                buffer = buffer[:newline_pos]
+
+        # The remaining buffer is the first line of the file.
+        # Only yield it if we're not using start_offset or if it starts before start_offset
+        if buffer and (start_offset is None or 0 < start_offset):
+            yield buffer, 0
 
     def write_logs(
         self,
@@ -221,8 +413,305 @@ class FileLogStorage(LogStorage):
     def _write_logs(self, log_file_path: Path, log_events: List[RunnerLogEvent]) -> None:
         log_events_parsed = [self._runner_log_event_to_log_event(event) for event in log_events]
         log_file_path.parent.mkdir(exist_ok=True, parents=True)
-        with open(log_file_path, "a") as f:
-            f.writelines(log.model_dump_json() + "\n" for log in log_events_parsed)
+        manifest = self._read_manifest(log_file_path)
+        index_file_path = self._get_index_file_path(log_file_path)
+        if not index_file_path.exists() and (log_file_path.exists() or manifest.sealed):
+            # A log file written by an older server version, index it once.
+            self._build_index(log_file_path)
+        active_segment_path = self._get_segment_file_path(log_file_path, manifest.active)
+        lines = [(log.model_dump_json() + "\n").encode() for log in log_events_parsed]
+        with open(active_segment_path, "ab") as f:
+            active_segment_size = f.tell()
+            f.writelines(lines)
+        offset = self._get_active_segment_offset(manifest) + active_segment_size
+        line_offsets = []
+        for line, event in zip(lines, log_events):
+            line_offsets.append((offset, event.timestamp))
+            offset += len(line)
+        self._update_index(index_file_path, line_offsets)
+        if active_segment_size + sum(len(line) for line in lines) >= self.segment_size:
+            self._seal_active_segment(log_file_path, manifest)
+
+    def _seal_active_segment(self, log_file_path: Path, manifest: _SegmentManifest) -> None:
+        """
+        Compresses the active segment and starts a new one. The manifest update is
+        the commit point, so that readers never see the same lines in two segments.
+        """
+        active_segment_path = self._get_segment_file_path(log_file_path, manifest.active)
+        segment = _Segment(
+            path=active_segment_path,
+            offset=self._get_active_segment_offset(manifest),
+            size=active_segment_path.stat().st_size,
+            sealed=None,
+        )
+        first_timestamp = None
+        for line, _ in self._read_lines(log_file_path, [segment], segment.offset):
+            first_timestamp = self._get_line_timestamp(line)
+            if first_timestamp is not None:
+                break
+        last_timestamp = None
+        with open(active_segment_path, "rb") as f:
+            for line, _ in self._read_file_lines_reversed(f):
+                last_timestamp = self._get_line_timestamp(line)
+                if last_timestamp is not None:
+                    break
+        if first_timestamp is None or last_timestamp is None:
+            # No valid lines, nothing worth sealing
+            return
+        sealed_segment_path = self._get_sealed_segment_file_path(log_file_path, manifest.active)
+        tmp_path = sealed_segment_path.with_name(f"{sealed_segment_path.name}.tmp")
+        members = []
+        with open(active_segment_path, "rb") as src, open(tmp_path, "wb") as dst:
+            member_offset = 0
+            while member_offset < segment.size:
+                data = src.read(min(_GZIP_MEMBER_SIZE, segment.size - member_offset))
+                if not data.endswith(b"\n") and member_offset + len(data) < segment.size:
+                    # Extend the member to the end of the line
+                    data += src.readline(segment.size - member_offset - len(data))
+                members.append(_GzipMember(offset=member_offset, compressed_offset=dst.tell()))
+                dst.write(gzip.compress(data))
+                member_offset += len(data)
+        os.replace(tmp_path, sealed_segment_path)
+        new_manifest = _SegmentManifest(
+            sealed=[
+                *manifest.sealed,
+                _SealedSegment(
+                    number=manifest.active,
+                    offset=segment.offset,
+                    size=segment.size,
+                    first_timestamp=first_timestamp,
+                    last_timestamp=last_timestamp,
+                    members=members,
+                ),
+            ],
+            active=manifest.active + 1,
+        )
+        self._write_manifest(log_file_path, new_manifest)
+        active_segment_path.unlink()
+
+    def _get_segments(self, log_file_path: Path) -> List[_Segment]:
+        """
+        Returns sealed segments followed by the active segment, if it exists.
+        """
+        manifest = self._read_manifest(log_file_path)
+        segments = [
+            _Segment(
+                path=self._get_sealed_segment_file_path(log_file_path, s.number),
+                offset=s.offset,
+                size=s.size,
+                sealed=s,
+            )
+            for s in manifest.sealed
+        ]
+        active_segment_path = self._get_segment_file_path(log_file_path, manifest.active)
+        try:
+            active_segment_size = active_segment_path.stat().st_size
+        except FileNotFoundError:
+            pass
+        else:
+            segments.append(
+                _Segment(
+                    path=active_segment_path,
+                    offset=self._get_active_segment_offset(manifest),
+                    size=active_segment_size,
+                    sealed=None,
+                )
+            )
+        return segments
+
+    def _open_segment(
+        self, log_file_path: Path, segment: _Segment
+    ) -> Tuple[_Segment, Optional[BinaryIO]]:
+        """
+        Opens the segment file for reading as is. If the active segment was sealed after
+        the manifest was read, opens the sealed segment instead. Returns `None` as the file
+        if the segment no longer exists.
+        """
+        try:
+            return segment, open(segment.path, "rb")
+        except FileNotFoundError:
+            if segment.sealed is not None:
+                return segment, None
+        for sealed_segment in self._get_segments(log_file_path):
+            if sealed_segment.sealed is not None and sealed_segment.offset == segment.offset:
+                try:
+                    return sealed_segment, open(sealed_segment.path, "rb")
+                except FileNotFoundError:
+                    break
+        return segment, None
+
+    def _get_active_segment_offset(self, manifest: _SegmentManifest) -> int:
+        if not manifest.sealed:
+            return 0
+        return manifest.sealed[-1].offset + manifest.sealed[-1].size
+
+    def _read_manifest(self, log_file_path: Path) -> _SegmentManifest:
+        try:
+            data = self._get_manifest_file_path(log_file_path).read_text()
+        except FileNotFoundError:
+            return _SegmentManifest()
+        return _SegmentManifest.model_validate_json(data)
+
+    def _write_manifest(self, log_file_path: Path, manifest: _SegmentManifest) -> None:
+        manifest_file_path = self._get_manifest_file_path(log_file_path)
+        tmp_path = manifest_file_path.with_name(f"{manifest_file_path.name}.tmp")
+        tmp_path.write_text(manifest.model_dump_json())
+        os.replace(tmp_path, manifest_file_path)
+
+    def _update_index(self, index_file_path: Path, line_offsets: List[Tuple[int, int]]) -> None:
+        """
+        Appends lines given as `(byte_offset, timestamp_ms)` to the index,
+        extending the last block or starting new ones.
+        """
+        mode = "r+b" if index_file_path.exists() else "w+b"
+        with open(index_file_path, mode) as f:
+            f.seek(0, os.SEEK_END)
+            index_size = f.tell()
+            index_size -= index_size % _INDEX_RECORD.size
+            last_entry = None
+            write_pos = index_size
+            if index_size > 0:
+                write_pos = index_size - _INDEX_RECORD.size
+                f.seek(write_pos)
+                last_entry = _IndexEntry._make(_INDEX_RECORD.unpack(f.read(_INDEX_RECORD.size)))
+            entries: List[_IndexEntry] = []
+            for offset, timestamp in line_offsets:
+                if last_entry is not None and offset - last_entry.offset < _INDEX_BLOCK_SIZE:
+                    last_entry = last_entry._replace(line_count=last_entry.line_count + 1)
+                    continue
+                if last_entry is not None:
+                    entries.append(last_entry)
+                    first_line = last_entry.first_line + last_entry.line_count
+                else:
+                    first_line = 0
+                last_entry = _IndexEntry(
+                    first_line=first_line,
+                    line_count=1,
+                    offset=offset,
+                    first_timestamp=timestamp,
+                )
+            if last_entry is not None:
+                entries.append(last_entry)
+            f.seek(write_pos)
+            f.write(b"".join(_INDEX_RECORD.pack(*e) for e in entries))
+            f.truncate()
+
+    def _build_index(self, log_file_path: Path) -> None:
+        index_file_path = self._get_index_file_path(log_file_path)
+        index_file_path.unlink(missing_ok=True)
+        line_offsets = []
+        offset = 0
+        last_timestamp = 0
+        for line, line_end_offset in self._read_lines(
+            log_file_path, self._get_segments(log_file_path), 0
+        ):
+            timestamp = self._get_line_timestamp(line)
+            if timestamp is not None:
+                last_timestamp = timestamp
+            # Malformed lines still count as lines, reuse the preceding timestamp
+            line_offsets.append((offset, last_timestamp))
+            offset = line_end_offset
+        self._update_index(index_file_path, line_offsets)
+
+    def _open_index(self, segments: List[_Segment], f: BinaryIO) -> Optional[_LogIndex]:
+        """
+        Returns the index for a log opened as `f` or `None` if there is no usable index.
+        """
+        index = _LogIndex(f, os.fstat(f.fileno()).st_size)
+        if len(index) == 0:
+            return None
+        if not segments or index[-1].offset >= segments[-1].end:
+            # The index is ahead of the log, e.g. the log was truncated.
+            return None
+        return index
+
+    def _find_line_offset(
+        self, log_file_path: Path, segments: List[_Segment], line: int
+    ) -> Optional[int]:
+        """
+        Returns the logical offset of the start of `line`,
+        or returns `None` if the log has fewer lines.
+        """
+        offset = 0
+        current_line = 0
+        try:
+            with open(self._get_index_file_path(log_file_path), "rb") as index_file:
+                index = self._open_index(segments, index_file)
+                entry = index.find_line(line) if index is not None else None
+                if entry is not None:
+                    offset = entry.offset
+                    current_line = entry.first_line
+        except FileNotFoundError:
+            pass
+        if current_line == line:
+            return offset
+        line_generator = self._read_lines(log_file_path, segments, offset)
+        for _, line_end_offset in line_generator:
+            current_line += 1
+            if current_line == line:
+                line_generator.close()
+                return line_end_offset
+        return None
+
+    def _find_start_offset(
+        self, log_file_path: Path, segments: List[_Segment], start_time: datetime
+    ) -> int:
+        """
+        Returns the offset of the block where lines newer than `start_time` may start.
+        """
+        timestamp = datetime_to_unix_time_ms(start_time)
+        # Sealed segments that end before `start_time` are skipped as a whole
+        offset = 0
+        for segment in segments:
+            if segment.sealed is None or segment.sealed.last_timestamp > timestamp:
+                break
+            offset = segment.end
+        try:
+            with open(self._get_index_file_path(log_file_path), "rb") as index_file:
+                index = self._open_index(segments, index_file)
+                if index is None:
+                    return offset
+                i = index.find_timestamp(timestamp) - 1
+                if i < 0:
+                    return offset
+                return max(offset, index[i].offset)
+        except FileNotFoundError:
+            return offset
+
+    def _find_end_offset(
+        self, log_file_path: Path, segments: List[_Segment], end_time: datetime
+    ) -> Optional[int]:
+        """
+        Returns the offset of the first block where all lines are newer than `end_time`
+        or `None` if there is no such block.
+        """
+        timestamp = datetime_to_unix_time_ms(end_time)
+        # Sealed segments that start after `end_time` are skipped as a whole
+        offset = None
+        for segment in segments:
+            if segment.sealed is not None and segment.sealed.first_timestamp > timestamp:
+                offset = segment.offset
+                break
+        try:
+            with open(self._get_index_file_path(log_file_path), "rb") as index_file:
+                index = self._open_index(segments, index_file)
+                if index is None:
+                    return offset
+                i = index.find_timestamp(timestamp)
+                if i >= len(index):
+                    return offset
+                if offset is None:
+                    return index[i].offset
+                return min(offset, index[i].offset)
+        except FileNotFoundError:
+            return offset
+
+    def _get_line_timestamp(self, line: bytes) -> Optional[int]:
+        try:
+            log_event = validate_json_extra_ignore(LogEvent, line.decode("utf-8"))
+        except Exception:
+            return None
+        return datetime_to_unix_time_ms(log_event.timestamp)
 
     def _get_log_file_path(
         self,
@@ -241,6 +730,22 @@ class FileLogStorage(LogStorage):
             / f"{producer.value}.log"
         )
 
+    def _get_segment_file_path(self, log_file_path: Path, number: int) -> Path:
+        # The first segment keeps the log file name for compatibility with unsegmented logs
+        if number == 0:
+            return log_file_path
+        return log_file_path.with_name(f"{log_file_path.stem}.{number:06d}{log_file_path.suffix}")
+
+    def _get_sealed_segment_file_path(self, log_file_path: Path, number: int) -> Path:
+        segment_file_path = self._get_segment_file_path(log_file_path, number)
+        return segment_file_path.with_name(f"{segment_file_path.name}.gz")
+
+    def _get_manifest_file_path(self, log_file_path: Path) -> Path:
+        return log_file_path.with_name(f"{log_file_path.name}.segments.json")
+
+    def _get_index_file_path(self, log_file_path: Path) -> Path:
+        return log_file_path.with_name(f"{log_file_path.name}.idx")
+
     def _runner_log_event_to_log_event(self, runner_log_event: RunnerLogEvent) -> LogEvent:
         return LogEvent(
             timestamp=unix_time_ms_to_datetime(runner_log_event.timestamp),
@@ -260,3 +765,12 @@ class FileLogStorage(LogStorage):
             raise ServerClientError(
                 f"Invalid next_token: {next_token}. Must be a non-negative integer."
             )
+
+    def _parse_ascending_next_token(self, next_token: str) -> Tuple[int, Optional[int]]:
+        """
+        Returns `(byte_offset, None)` for offset tokens
+        and `(0, line_number)` for legacy line number tokens.
+        """
+        if next_token.startswith(_OFFSET_TOKEN_PREFIX):
+            return self._parse_next_token(next_token[len(_OFFSET_TOKEN_PREFIX) :]), None
+        return 0, self._parse_next_token(next_token)
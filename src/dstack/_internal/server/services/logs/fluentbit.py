@@ -160,7 +160,10 @@ else:
         def close(self) -> None: ...
 
     class HTTPFluentBitWriter:
-        """Writes logs to Fluent-bit via HTTP POST."""
+        """
+        Writes logs to Fluent-bit via HTTP POST.
+        Records are sent in one request as a JSON array, which the Fluent-bit HTTP input accepts.
+        """
 
         def __init__(self, host: str, port: int, tag_prefix: str) -> None:
             self._endpoint = f"http://{host}:{port}"
@@ -169,20 +172,19 @@ else:
 
         def write(self, tag: str, records: List[dict]) -> None:
             prefixed_tag = f"{self._tag_prefix}.{tag}" if self._tag_prefix else tag
-            for record in records:
-                try:
-                    response = self._client.post(
-                        f"{self._endpoint}/{prefixed_tag}",
-                        json=record,
-                        headers={"Content-Type": "application/json"},
-                    )
-                    response.raise_for_status()
-                except httpx.HTTPStatusError as e:
-                    raise LogStorageError(
-                        f"Fluent-bit HTTP error: status {e.response.status_code}"
-                    ) from e
-                except httpx.HTTPError as e:
-                    raise LogStorageError(f"Fluent-bit HTTP error: {e}") from e
+            try:
+                response = self._client.post(
+                    f"{self._endpoint}/{prefixed_tag}",
+                    json=records,
+                    headers={"Content-Type": "application/json"},
+                )
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise LogStorageError(
+                    f"Fluent-bit HTTP error: status {e.response.status_code}"
+                ) from e
+            except httpx.HTTPError as e:
+                raise LogStorageError(f"Fluent-bit HTTP error: {e}") from e
 
         def close(self) -> None:
             self._client.close()
@@ -1,5 +1,5 @@
 import urllib.parse
-from typing import List
+from typing import List, Tuple
 from uuid import UUID
 
 from dstack._internal.core.errors import ServerClientError
@@ -15,9 +15,10 @@ from dstack._internal.server.schemas.runner import LogEvent as RunnerLogEvent
 from dstack._internal.server.services.logs.base import (
     LogStorage,
     LogStorageError,
+    LogWrite,
+    LogWritesError,
     unix_time_ms_to_datetime,
 )
-from dstack._internal.utils.common import batched
 from dstack._internal.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -124,47 +125,74 @@ else:
             runner_logs: List[RunnerLogEvent],
             job_logs: List[RunnerLogEvent],
         ):
-            producers_with_logs = [(LogProducer.RUNNER, runner_logs), (LogProducer.JOB, job_logs)]
-            for producer, producer_logs in producers_with_logs:
-                stream_name = self._get_stream_name(
-                    project_name=project.name,
-                    run_name=run_name,
-                    job_submission_id=job_submission_id,
-                    producer=producer,
-                )
-                self._write_logs_to_stream(
-                    stream_name=stream_name,
-                    logs=producer_logs,
-                )
+            self.write_logs_many(
+                [
+                    LogWrite(
+                        project=project,
+                        run_name=run_name,
+                        job_submission_id=job_submission_id,
+                        runner_logs=runner_logs,
+                        job_logs=job_logs,
+                    )
+                ]
+            )
+
+        def write_logs_many(self, writes: List[LogWrite]):
+            # All streams share one log, so logs of different jobs are written in the same batches.
+            # Entries are (write index, stream name, log event).
+            entries: List[Tuple[int, str, RunnerLogEvent]] = []
+            for i, write in enumerate(writes):
+                producers_with_logs = [
+                    (LogProducer.RUNNER, write.runner_logs),
+                    (LogProducer.JOB, write.job_logs),
+                ]
+                for producer, producer_logs in producers_with_logs:
+                    stream_name = self._get_stream_name(
+                        project_name=write.project.name,
+                        run_name=write.run_name,
+                        job_submission_id=write.job_submission_id,
+                        producer=producer,
+                    )
+                    entries.extend((i, stream_name, log) for log in producer_logs)
+            # Writes before this index are fully committed
+            committed = 0
+            with self.logger.batch() as batcher:
+                for start in range(0, len(entries), self.MAX_BATCH_SIZE):
+                    end = start + self.MAX_BATCH_SIZE
+                    for _, stream_name, log in entries[start:end]:
+                        self._log_to_batch(batcher, stream_name, log)
+                    try:
+                        batcher.commit()
+                    except Exception as e:
+                        if committed == 0:
+                            raise
+                        raise LogWritesError(writes[committed:], e) from e
+                    committed = entries[end][0] if end < len(entries) else len(writes)
 
         def close(self):
             self.client.close()
 
-        def _write_logs_to_stream(self, stream_name: str, logs: List[RunnerLogEvent]):
-            with self.logger.batch() as batcher:
-                for batch in batched(logs, self.MAX_BATCH_SIZE):
-                    for log in batch:
-                        message = log.message.decode(errors="replace")
-                        timestamp = unix_time_ms_to_datetime(log.timestamp)
-                        if len(log.message) > self.MAX_RUNNER_MESSAGE_SIZE:
-                            logger.error(
-                                "Stream %s: skipping event at %s, message exceeds max size: %d > %d",
-                                stream_name,
-                                timestamp.isoformat(),
-                                len(log.message),
-                                self.MAX_RUNNER_MESSAGE_SIZE,
-                            )
-                            continue
-                        batcher.log_struct(
-                            {
-                                "message": message,
-                            },
-                            labels={
-                                "stream": stream_name,
-                            },
-                            timestamp=timestamp,
-                        )
-                    batcher.commit()
+        def _log_to_batch(self, batcher, stream_name: str, log: RunnerLogEvent):
+            message = log.message.decode(errors="replace")
+            timestamp = unix_time_ms_to_datetime(log.timestamp)
+            if len(log.message) > self.MAX_RUNNER_MESSAGE_SIZE:
+                logger.error(
+                    "Stream %s: skipping event at %s, message exceeds max size: %d > %d",
+                    stream_name,
+                    timestamp.isoformat(),
+                    len(log.message),
+                    self.MAX_RUNNER_MESSAGE_SIZE,
+                )
+                return
+            batcher.log_struct(
+                {
+                    "message": message,
+                },
+                labels={
+                    "stream": stream_name,
+                },
+                timestamp=timestamp,
+            )
 
         def _get_stream_name(
             self, project_name: str, run_name: str, job_submission_id: UUID, producer: LogProducer
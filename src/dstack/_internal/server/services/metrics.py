@@ -1,21 +1,100 @@
 import json
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, List, NamedTuple, Optional
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from dstack._internal.core.models.common import CoreModel
 from dstack._internal.core.models.instances import Resources
 from dstack._internal.core.models.metrics import JobMetrics, Metric
-from dstack._internal.server.models import JobMetricsPoint, JobModel
+from dstack._internal.server import settings
+from dstack._internal.server.models import JobMetricsPoint, JobMetricsRollup, JobModel
 from dstack._internal.server.services.jobs import get_job_provisioning_data, get_job_runtime_data
-from dstack._internal.utils.common import get_or_error
+from dstack._internal.utils.common import get_current_datetime, get_or_error
 from dstack._internal.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+RAW_RESOLUTION_SECONDS = 0
+# Resolutions of `JobMetricsRollup` tiers, from the finest to the coarsest.
+# Raw points of running jobs are rolled up into the finest tier once they are older than
+# `SERVER_METRICS_RUNNING_TTL_SECONDS`, each tier is rolled up into the next one once it is
+# older than its retention. The coarsest tier is kept until the job is finished.
+ROLLUP_RESOLUTIONS_SECONDS = (60, 600, 3600)
+ROLLUP_RETENTION_SECONDS = {
+    60: 24 * 3600,
+    600: 7 * 24 * 3600,
+}
+# Raw points are collected every ~10 seconds.
+_RAW_POINTS_INTERVAL_SECONDS = 10
+# The auto-picked resolution is the finest one that fits the time range into that many points.
+_MAX_POINTS_PER_RANGE = 1000
+
+
+class MetricAggregate(CoreModel):
+    min: float
+    max: float
+    sum: float
+    count: int
+
+    @classmethod
+    def of(cls, value: float) -> "MetricAggregate":
+        return cls(min=value, max=value, sum=value, count=1)
+
+    @property
+    def avg(self) -> float:
+        return self.sum / self.count
+
+    def merge(self, other: "MetricAggregate") -> "MetricAggregate":
+        return MetricAggregate(
+            min=min(self.min, other.min),
+            max=max(self.max, other.max),
+            sum=self.sum + other.sum,
+            count=self.count + other.count,
+        )
+
+
+class JobMetricsAggregates(CoreModel):
+    cpu_usage_percent: Optional[MetricAggregate] = None
+    """`cpu_usage_percent` is `None` if the bucket has no pair of consecutive raw points."""
+    memory_usage_bytes: MetricAggregate
+    memory_working_set_bytes: MetricAggregate
+    gpus_memory_usage_bytes: List[MetricAggregate]
+    gpus_util_percent: List[MetricAggregate]
+
+    def merge(self, other: "JobMetricsAggregates") -> "JobMetricsAggregates":
+        cpu_usage_percent = self.cpu_usage_percent
+        if cpu_usage_percent is None:
+            cpu_usage_percent = other.cpu_usage_percent
+        elif other.cpu_usage_percent is not None:
+            cpu_usage_percent = cpu_usage_percent.merge(other.cpu_usage_percent)
+        gpus_memory_usage_bytes = self.gpus_memory_usage_bytes
+        gpus_util_percent = self.gpus_util_percent
+        # If the number of GPUs changed within the bucket, keep the earlier GPUs,
+        # they cannot be matched by an array index.
+        if len(other.gpus_memory_usage_bytes) == len(gpus_memory_usage_bytes) and len(
+            other.gpus_util_percent
+        ) == len(gpus_util_percent):
+            gpus_memory_usage_bytes = [
+                a.merge(b) for a, b in zip(gpus_memory_usage_bytes, other.gpus_memory_usage_bytes)
+            ]
+            gpus_util_percent = [
+                a.merge(b) for a, b in zip(gpus_util_percent, other.gpus_util_percent)
+            ]
+        return JobMetricsAggregates(
+            cpu_usage_percent=cpu_usage_percent,
+            memory_usage_bytes=self.memory_usage_bytes.merge(other.memory_usage_bytes),
+            memory_working_set_bytes=self.memory_working_set_bytes.merge(
+                other.memory_working_set_bytes
+            ),
+            gpus_memory_usage_bytes=gpus_memory_usage_bytes,
+            gpus_util_percent=gpus_util_percent,
+        )
+
 
 async def get_job_metrics(
     session: AsyncSession,
@@ -23,6 +102,7 @@ async def get_job_metrics(
     after: Optional[datetime] = None,
     before: Optional[datetime] = None,
     limit: Optional[int] = None,
+    resolution_seconds: Optional[int] = None,
 ) -> JobMetrics:
     """
     Returns metrics ordered from the latest to the earliest.
@@ -31,7 +111,304 @@ async def get_job_metrics(
         * limit=100 — get the latest 100 points
         * after=<now - 1 hour> — get points for the last one hour
         * before=<earliest timestamp from the last batch>, limit=100 ­— paginate back in history
+
+    `resolution_seconds` is either `RAW_RESOLUTION_SECONDS` or one of `ROLLUP_RESOLUTIONS_SECONDS`.
+    If not set, it's picked based on the time range. Rolled up values are bucket averages
+    timestamped with the bucket start. Time ranges that have only been kept at a coarser
+    resolution are returned at that resolution.
     """
+    # Raw points cover the last `SERVER_METRICS_RUNNING_TTL_SECONDS` of the job's metrics,
+    # older ones may already be rolled up.
+    res = await session.execute(
+        select(func.max(JobMetricsPoint.timestamp_micro)).where(
+            JobMetricsPoint.job_id == job_model.id
+        )
+    )
+    latest_point_timestamp_micro = res.scalar()
+    if resolution_seconds is None:
+        end = before
+        if end is None and latest_point_timestamp_micro is not None:
+            end = _unix_time_micro_to_datetime(latest_point_timestamp_micro)
+        resolution_seconds = _pick_resolution(after=after, before=end)
+    if resolution_seconds == RAW_RESOLUTION_SECONDS and (
+        after is None
+        or latest_point_timestamp_micro is None
+        or _datetime_to_unix_time_micro(after)
+        >= latest_point_timestamp_micro - settings.SERVER_METRICS_RUNNING_TTL_SECONDS * 1_000_000
+    ):
+        return await _get_raw_job_metrics(
+            session=session, job_model=job_model, after=after, before=before, limit=limit
+        )
+    return await _get_rolled_up_job_metrics(
+        session=session,
+        job_model=job_model,
+        after=after,
+        before=before,
+        limit=limit,
+        resolution_seconds=max(resolution_seconds, ROLLUP_RESOLUTIONS_SECONDS[0]),
+    )
+
+
+async def rollup_job_metrics_points(
+    session: AsyncSession, job_ids: Sequence[UUID], timestamp_micro_cutoff: int
+) -> bool:
+    """
+    Replaces `JobMetricsPoint` of `job_ids` older than `timestamp_micro_cutoff` with rollups
+    of the finest resolution. `timestamp_micro_cutoff` must be aligned to the resolution.
+
+    Returns `False` if the points were changed concurrently, e.g. by another server replica.
+    Nothing is committed in that case.
+    """
+    conditions = (
+        JobMetricsPoint.job_id.in_(job_ids),
+        JobMetricsPoint.timestamp_micro < timestamp_micro_cutoff,
+    )
+    res = await session.execute(
+        select(JobMetricsPoint)
+        .where(*conditions)
+        .order_by(JobMetricsPoint.job_id, JobMetricsPoint.timestamp_micro)
+    )
+    points = res.scalars().all()
+    if len(points) == 0:
+        return True
+    points_by_job_id: defaultdict[UUID, list[JobMetricsPoint]] = defaultdict(list)
+    for point in points:
+        points_by_job_id[point.job_id].append(point)
+    resolution_seconds = ROLLUP_RESOLUTIONS_SECONDS[0]
+    for job_id, job_points in points_by_job_id.items():
+        _add_rollups(
+            session, job_id, resolution_seconds, aggregate_points(job_points, resolution_seconds)
+        )
+    return await _delete_rolled_up(
+        session, delete(JobMetricsPoint).where(*conditions), len(points)
+    )
+
+
+async def rollup_job_metrics_rollups(
+    session: AsyncSession,
+    job_ids: Sequence[UUID],
+    resolution_seconds: int,
+    target_resolution_seconds: int,
+    timestamp_micro_cutoff: int,
+) -> bool:
+    """
+    Replaces `resolution_seconds` rollups of `job_ids` older than `timestamp_micro_cutoff` with
+    `target_resolution_seconds` rollups. `timestamp_micro_cutoff` must be aligned to the
+    target resolution.
+
+    Returns `False` if the rollups were changed concurrently, e.g. by another server replica.
+    Nothing is committed in that case.
+    """
+    conditions = (
+        JobMetricsRollup.job_id.in_(job_ids),
+        JobMetricsRollup.resolution_seconds == resolution_seconds,
+        JobMetricsRollup.timestamp_micro < timestamp_micro_cutoff,
+    )
+    res = await session.execute(
+        select(JobMetricsRollup)
+        .where(*conditions)
+        .order_by(JobMetricsRollup.job_id, JobMetricsRollup.timestamp_micro)
+    )
+    rollups = res.scalars().all()
+    if len(rollups) == 0:
+        return True
+    rollups_by_job_id: defaultdict[UUID, list[JobMetricsRollup]] = defaultdict(list)
+    for rollup in rollups:
+        rollups_by_job_id[rollup.job_id].append(rollup)
+    for job_id, job_rollups in rollups_by_job_id.items():
+        _add_rollups(
+            session,
+            job_id,
+            target_resolution_seconds,
+            aggregate_rollups(job_rollups, target_resolution_seconds),
+        )
+    return await _delete_rolled_up(
+        session, delete(JobMetricsRollup).where(*conditions), len(rollups)
+    )
+
+
+def aggregate_points(
+    points: Sequence[JobMetricsPoint], resolution_seconds: int
+) -> Dict[int, JobMetricsAggregates]:
+    """
+    Aggregates `points` ordered from the earliest to the latest into buckets keyed by
+    the bucket start.
+    """
+    buckets: Dict[int, JobMetricsAggregates] = {}
+    prev_point: Optional[JobMetricsPoint] = None
+    for point in points:
+        cpu_usage_percent = None
+        if prev_point is not None:
+            cpu_usage_percent = MetricAggregate.of(_get_cpu_usage(point, prev_point))
+        aggregates = JobMetricsAggregates(
+            cpu_usage_percent=cpu_usage_percent,
+            memory_usage_bytes=MetricAggregate.of(point.memory_usage_bytes),
+            memory_working_set_bytes=MetricAggregate.of(point.memory_working_set_bytes),
+            gpus_memory_usage_bytes=[
+                MetricAggregate.of(v) for v in json.loads(point.gpus_memory_usage_bytes)
+            ],
+            gpus_util_percent=[MetricAggregate.of(v) for v in json.loads(point.gpus_util_percent)],
+        )
+        _add_to_bucket(buckets, _get_bucket(point.timestamp_micro, resolution_seconds), aggregates)
+        prev_point = point
+    return buckets
+
+
+def aggregate_rollups(
+    rollups: Iterable[JobMetricsRollup], resolution_seconds: int
+) -> Dict[int, JobMetricsAggregates]:
+    """
+    Aggregates `rollups` of a finer resolution into buckets keyed by the bucket start.
+    """
+    buckets: Dict[int, JobMetricsAggregates] = {}
+    for rollup in rollups:
+        _add_to_bucket(
+            buckets,
+            _get_bucket(rollup.timestamp_micro, resolution_seconds),
+            JobMetricsAggregates.model_validate_json(rollup.aggregates),
+        )
+    return buckets
+
+
+def align_timestamp_micro(timestamp_micro: int, resolution_seconds: int) -> int:
+    return _get_bucket(timestamp_micro, resolution_seconds)
+
+
+def _add_rollups(
+    session: AsyncSession,
+    job_id: UUID,
+    resolution_seconds: int,
+    buckets: Dict[int, JobMetricsAggregates],
+) -> None:
+    session.add_all(
+        JobMetricsRollup(
+            job_id=job_id,
+            resolution_seconds=resolution_seconds,
+            timestamp_micro=timestamp_micro,
+            aggregates=aggregates.model_dump_json(),
+        )
+        for timestamp_micro, aggregates in buckets.items()
+    )
+
+
+async def _delete_rolled_up(session: AsyncSession, stmt, expected_count: int) -> bool:
+    res = await session.execute(stmt)
+    if res.rowcount != expected_count:  # pyright: ignore[reportAttributeAccessIssue]
+        # Rows were rolled up by another replica or added since they were selected.
+        # Committing would duplicate or lose data, so retry on the next run.
+        await session.rollback()
+        return False
+    await session.commit()
+    return True
+
+
+def _add_to_bucket(
+    buckets: Dict[int, JobMetricsAggregates], bucket: int, aggregates: JobMetricsAggregates
+) -> None:
+    if bucket in buckets:
+        buckets[bucket] = buckets[bucket].merge(aggregates)
+    else:
+        buckets[bucket] = aggregates
+
+
+def _get_bucket(timestamp_micro: int, resolution_seconds: int) -> int:
+    return timestamp_micro - timestamp_micro % (resolution_seconds * 1_000_000)
+
+
+def _pick_resolution(after: Optional[datetime], before: Optional[datetime]) -> int:
+    if after is None:
+        return RAW_RESOLUTION_SECONDS
+    if before is None:
+        before = get_current_datetime()
+    range_seconds = (before - after).total_seconds()
+    if range_seconds / _RAW_POINTS_INTERVAL_SECONDS <= _MAX_POINTS_PER_RANGE:
+        return RAW_RESOLUTION_SECONDS
+    for resolution_seconds in ROLLUP_RESOLUTIONS_SECONDS:
+        if range_seconds / resolution_seconds <= _MAX_POINTS_PER_RANGE:
+            return resolution_seconds
+    return ROLLUP_RESOLUTIONS_SECONDS[-1]
+
+
+class _Sample(NamedTuple):
+    timestamp: datetime
+    cpu_usage_percent: int
+    memory_usage_bytes: int
+    memory_working_set_bytes: int
+    gpus_memory_usage_bytes: List[int]
+    gpus_util_percent: List[int]
+
+
+async def _get_rolled_up_job_metrics(
+    session: AsyncSession,
+    job_model: JobModel,
+    after: Optional[datetime],
+    before: Optional[datetime],
+    limit: Optional[int],
+    resolution_seconds: int,
+) -> JobMetrics:
+    rollups_stmt = select(JobMetricsRollup).where(JobMetricsRollup.job_id == job_model.id)
+    # Points are needed from one point before the range for cpu_usage_percent.
+    points_stmt = (
+        select(JobMetricsPoint)
+        .where(JobMetricsPoint.job_id == job_model.id)
+        .order_by(JobMetricsPoint.timestamp_micro)
+    )
+    if after is not None:
+        after_micro = _get_bucket(_datetime_to_unix_time_micro(after), resolution_seconds)
+        rollups_stmt = rollups_stmt.where(JobMetricsRollup.timestamp_micro >= after_micro)
+        points_stmt = points_stmt.where(JobMetricsPoint.timestamp_micro >= after_micro)
+    if before is not None:
+        before_micro = _datetime_to_unix_time_micro(before)
+        rollups_stmt = rollups_stmt.where(JobMetricsRollup.timestamp_micro < before_micro)
+        points_stmt = points_stmt.where(JobMetricsPoint.timestamp_micro < before_micro)
+    res = await session.execute(rollups_stmt)
+    rollups = res.scalars().all()
+    res = await session.execute(points_stmt)
+    points = res.scalars().all()
+
+    buckets = aggregate_rollups(
+        (r for r in rollups if r.resolution_seconds <= resolution_seconds), resolution_seconds
+    )
+    for rollup in rollups:
+        if rollup.resolution_seconds > resolution_seconds:
+            # Only kept at a coarser resolution.
+            _add_to_bucket(
+                buckets,
+                rollup.timestamp_micro,
+                JobMetricsAggregates.model_validate_json(rollup.aggregates),
+            )
+    for bucket, aggregates in aggregate_points(points, resolution_seconds).items():
+        _add_to_bucket(buckets, bucket, aggregates)
+
+    samples: list[_Sample] = []
+    for bucket in sorted(buckets, reverse=True):
+        aggregates = buckets[bucket]
+        if aggregates.cpu_usage_percent is None:
+            continue
+        samples.append(
+            _Sample(
+                timestamp=_unix_time_micro_to_datetime(bucket),
+                cpu_usage_percent=round(aggregates.cpu_usage_percent.avg),
+                memory_usage_bytes=round(aggregates.memory_usage_bytes.avg),
+                memory_working_set_bytes=round(aggregates.memory_working_set_bytes.avg),
+                gpus_memory_usage_bytes=[round(a.avg) for a in aggregates.gpus_memory_usage_bytes],
+                gpus_util_percent=[round(a.avg) for a in aggregates.gpus_util_percent],
+            )
+        )
+        if limit is not None and len(samples) == limit:
+            break
+    if len(samples) == 0:
+        return JobMetrics(metrics=[])
+    return _make_job_metrics(job_model, samples)
+
+
+async def _get_raw_job_metrics(
+    session: AsyncSession,
+    job_model: JobModel,
+    after: Optional[datetime],
+    before: Optional[datetime],
+    limit: Optional[int],
+) -> JobMetrics:
     stmt = (
         select(JobMetricsPoint)
         .where(JobMetricsPoint.job_id == job_model.id)
@@ -54,6 +431,21 @@ async def get_job_metrics(
 
 
 def _calculate_job_metrics(job_model: JobModel, points: Sequence[JobMetricsPoint]) -> JobMetrics:
+    samples = [
+        _Sample(
+            timestamp=_unix_time_micro_to_datetime(point.timestamp_micro),
+            cpu_usage_percent=_get_cpu_usage(point, prev_point),
+            memory_usage_bytes=point.memory_usage_bytes,
+            memory_working_set_bytes=point.memory_working_set_bytes,
+            gpus_memory_usage_bytes=json.loads(point.gpus_memory_usage_bytes),
+            gpus_util_percent=json.loads(point.gpus_util_percent),
+        )
+        for point, prev_point in zip(points, points[1:])
+    ]
+    return _make_job_metrics(job_model, samples)
+
+
+def _make_job_metrics(job_model: JobModel, samples: Sequence[_Sample]) -> JobMetrics:
     timestamps: list[datetime] = []
     cpu_usage_points: list[int] = []
     memory_usage_points: list[int] = []
@@ -80,13 +472,13 @@ def _calculate_job_metrics(job_model: JobModel, points: Sequence[JobMetricsPoint
 
     gpus_detected_num: Optional[int] = None
     gpus_detected_num_mismatch: bool = False
-    for point, prev_point in zip(points, points[1:]):
-        timestamps.append(_unix_time_micro_to_datetime(point.timestamp_micro))
-        cpu_usage_points.append(_get_cpu_usage(point, prev_point))
-        memory_usage_points.append(point.memory_usage_bytes)
-        memory_working_set_points.append(point.memory_working_set_bytes)
-        gpus_memory_usage = json.loads(point.gpus_memory_usage_bytes)
-        gpus_util = json.loads(point.gpus_util_percent)
+    for sample in samples:
+        timestamps.append(sample.timestamp)
+        cpu_usage_points.append(sample.cpu_usage_percent)
+        memory_usage_points.append(sample.memory_usage_bytes)
+        memory_working_set_points.append(sample.memory_working_set_bytes)
+        gpus_memory_usage = sample.gpus_memory_usage_bytes
+        gpus_util = sample.gpus_util_percent
         if gpus_detected_num is None:
             gpus_detected_num = len(gpus_memory_usage)
         if len(gpus_memory_usage) != gpus_detected_num or len(gpus_util) != gpus_detected_num:
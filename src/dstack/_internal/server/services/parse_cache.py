@@ -0,0 +1,80 @@
+"""
+A process-wide cache of pydantic models parsed from JSON columns, such as `RunModel.run_spec`.
+
+Entries are keyed by the model type and the row id and are valid as long as the column content
+is unchanged, so updated rows are re-parsed. The cache is bounded by the total size of
+the cached JSON content, the least recently used entries are evicted first.
+
+Cached models are shared by all callers and must not be mutated –
+copy them with `model_copy(deep=True)` first.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional, TypeVar
+from uuid import UUID
+
+from dstack._internal.core.models.common import validate_json_extra_ignore
+from dstack._internal.server import settings
+from dstack._internal.server.services.prometheus.client_metrics import parse_cache_metrics
+
+T = TypeVar("T")
+
+
+class _Entry(NamedTuple):
+    data: str
+    model: Any
+    dump: Optional[str]
+    """`dump` is the model serialized when cached if `ParseCache.verify` is set."""
+
+
+class ParseCacheError(Exception):
+    pass
+
+
+class ParseCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.verify = False
+        """If set, cache hits check that the cached model was not mutated. Used in tests."""
+        self._entries: OrderedDict[tuple[type, UUID], _Entry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def parse(self, tp: type[T], row_id: Optional[UUID], data: str) -> T:
+        if row_id is None or len(data) > self.max_size:
+            # Rows that are not flushed yet have no id.
+            return validate_json_extra_ignore(tp, data)
+        key = (tp, row_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.data == data:
+                self._entries.move_to_end(key)
+        if entry is not None and entry.data == data:
+            parse_cache_metrics.increment_hits(tp.__name__)
+            if entry.dump is not None and entry.model.model_dump_json() != entry.dump:
+                raise ParseCacheError(f"Cached {tp.__name__} of row {row_id} was mutated")
+            return entry.model
+        parse_cache_metrics.increment_misses(tp.__name__)
+        model = validate_json_extra_ignore(tp, data)
+        dump = model.model_dump_json() if self.verify else None  # type: ignore[attr-defined]
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._size -= len(old_entry.data)
+            self._entries[key] = _Entry(data=data, model=model, dump=dump)
+            self._size += len(data)
+            while self._size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.data)
+            parse_cache_metrics.set_size(self._size)
+        return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            parse_cache_metrics.set_size(0)
+
+
+parse_cache = ParseCache(max_size=settings.SERVER_PARSE_CACHE_MAX_SIZE)
@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 
 class RunMetrics:
@@ -52,4 +52,56 @@ class RunMetrics:
         self._pending_runs_total.labels(project_name=project_name, run_type=run_type).inc()
 
 
+class JobMetricsCollectionMetrics:
+    """Wrapper class for Prometheus metrics of job metrics collection."""
+
+    def __init__(self):
+        self._collection_interval = Histogram(
+            "dstack_job_metrics_collection_interval_seconds",
+            "Achieved interval between consecutive metrics collections of a running job",
+            buckets=[5, 10, 15, 20, 30, 45, 60, 120, 300, float("inf")],
+        )
+        self._missed_jobs_total = Counter(
+            "dstack_job_metrics_collection_missed_jobs_total",
+            "Number of jobs skipped by metrics collection due to a missed deadline",
+        )
+
+    def observe_collection_interval(self, interval_seconds: float):
+        self._collection_interval.observe(interval_seconds)
+
+    def increment_missed_jobs(self):
+        self._missed_jobs_total.inc()
+
+
+class ParseCacheMetrics:
+    """Wrapper class for Prometheus metrics of the parsed JSON columns cache."""
+
+    def __init__(self):
+        self._hits_total = Counter(
+            "dstack_server_parse_cache_hits_total",
+            "Number of JSON column models returned from the parse cache",
+            labelnames=["model"],
+        )
+        self._misses_total = Counter(
+            "dstack_server_parse_cache_misses_total",
+            "Number of JSON column models parsed due to a parse cache miss",
+            labelnames=["model"],
+        )
+        self._size = Gauge(
+            "dstack_server_parse_cache_size_bytes",
+            "Total size of the JSON content of the models in the parse cache",
+        )
+
+    def increment_hits(self, model: str):
+        self._hits_total.labels(model=model).inc()
+
+    def increment_misses(self, model: str):
+        self._misses_total.labels(model=model).inc()
+
+    def set_size(self, size: int):
+        self._size.set(size)
+
+
 run_metrics = RunMetrics()
+job_metrics_collection_metrics = JobMetricsCollectionMetrics()
+parse_cache_metrics = ParseCacheMetrics()
@@ -68,6 +68,7 @@ from dstack._internal.server.services.jobs import (
     remove_job_spec_sensitive_info,
 )
 from dstack._internal.server.services.locking import get_locker, string_to_lock_id
+from dstack._internal.server.services.parse_cache import parse_cache
 from dstack._internal.server.services.pipelines import PipelineHinterProtocol
 from dstack._internal.server.services.plugins import apply_plugin_policies
 from dstack._internal.server.services.probes import is_probe_ready
@@ -153,7 +154,7 @@ def get_run_status_change_message(
 
 
 def get_run_spec(run_model: RunModel) -> RunSpec:
-    return validate_json_extra_ignore(RunSpec, run_model.run_spec)
+    return parse_cache.parse(RunSpec, run_model.id, run_model.run_spec)
 
 
 def gateway_registration_failed(run_model: RunModel) -> bool:
@@ -1072,16 +1073,20 @@ def _get_run_jobs_with_submissions(
                     if return_in_api:
                         # Set default non-None values for 0.18 backward-compatibility
                         # Remove in 0.19
-                        if job_submission.job_provisioning_data is not None:
-                            if job_submission.job_provisioning_data.hostname is None:
-                                job_submission.job_provisioning_data.hostname = ""
-                            if job_submission.job_provisioning_data.ssh_port is None:
-                                job_submission.job_provisioning_data.ssh_port = 22
+                        jpd = job_submission.job_provisioning_data
+                        if jpd is not None and (jpd.hostname is None or jpd.ssh_port is None):
+                            job_submission.job_provisioning_data = jpd.model_copy(
+                                update={
+                                    "hostname": jpd.hostname or "",
+                                    "ssh_port": jpd.ssh_port or 22,
+                                }
+                            )
                     submissions.append(job_submission)
             if job_model is not None:
                 # Use the spec from the latest submission. Submissions can have different specs
                 job_spec = get_job_spec(job_model)
                 if not include_sensitive:
+                    job_spec = job_spec.model_copy()
                     remove_job_spec_sensitive_info(job_spec)
                 job_connection_info: Optional[JobConnectionInfo] = None
                 if include_job_connection_info and job_model.status == JobStatus.RUNNING:
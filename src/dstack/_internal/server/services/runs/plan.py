@@ -1056,9 +1056,10 @@ def _get_offers_from_instances(
     instances_with_offers = []
     for instance in instances:
         offer = common_utils.get_or_error(get_instance_offer(instance))
-        offer.availability = InstanceAvailability.BUSY
+        availability = InstanceAvailability.BUSY
         if instance.status == InstanceStatus.IDLE:
-            offer.availability = InstanceAvailability.IDLE
+            availability = InstanceAvailability.IDLE
+        offer = offer.model_copy(update={"availability": availability})
         instances_with_offers.append((instance, offer))
     return instances_with_offers
 
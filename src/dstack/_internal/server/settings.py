@@ -90,6 +90,21 @@ SERVER_S3_BUCKET_REGION = os.getenv(
 
 SERVER_GCS_BUCKET = os.getenv("DSTACK_SERVER_GCS_BUCKET")
 
+# Size of uncompressed file-based log segments. Full segments are compressed with gzip.
+SERVER_FILE_LOG_SEGMENT_SIZE = environ.get_int(
+    "DSTACK_SERVER_FILE_LOG_SEGMENT_SIZE", default=16 * 2**20
+)
+
+# Logs written to CloudWatch, GCP Logging, and Fluent-bit are buffered and written in bulk.
+# Buffered logs are not pulled from the runner again if writing fails or the server crashes.
+# 0 disables buffering.
+SERVER_LOG_BUFFER_FLUSH_INTERVAL = environ.get_int(
+    "DSTACK_SERVER_LOG_BUFFER_FLUSH_INTERVAL", default=2
+)
+SERVER_LOG_BUFFER_MAX_SIZE = environ.get_int(
+    "DSTACK_SERVER_LOG_BUFFER_MAX_SIZE", default=64 * 2**20
+)
+
 SERVER_CLOUDWATCH_LOG_GROUP = os.getenv("DSTACK_SERVER_CLOUDWATCH_LOG_GROUP")
 SERVER_CLOUDWATCH_LOG_REGION = os.getenv("DSTACK_SERVER_CLOUDWATCH_LOG_REGION")
 
@@ -110,6 +125,13 @@ SERVER_METRICS_RUNNING_TTL_SECONDS = environ.get_int(
 SERVER_METRICS_FINISHED_TTL_SECONDS = environ.get_int(
     "DSTACK_SERVER_METRICS_FINISHED_TTL_SECONDS", default=7 * 24 * 3600
 )
+SERVER_METRICS_COLLECTION_CONCURRENCY = environ.get_int(
+    "DSTACK_SERVER_METRICS_COLLECTION_CONCURRENCY", default=32
+)
+# Bounds the total size of the JSON content of the cached models.
+SERVER_PARSE_CACHE_MAX_SIZE = environ.get_int(
+    "DSTACK_SERVER_PARSE_CACHE_MAX_SIZE", default=32 * 2**20
+)
 SERVER_INSTANCE_HEALTH_TTL_SECONDS = environ.get_int(
     "DSTACK_SERVER_INSTANCE_HEALTH_TTL_SECONDS", default=7 * 24 * 3600
 )
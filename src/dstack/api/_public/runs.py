@@ -3,6 +3,7 @@ import queue
 import tempfile
 import threading
 import time
+import uuid
 from abc import ABC
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -17,7 +18,13 @@ from websocket import WebSocketApp
 import dstack.api as api
 from dstack._internal.core.consts import DSTACK_RUNNER_HTTP_PORT, DSTACK_RUNNER_SSH_PORT
 from dstack._internal.core.deprecated import Deprecated
-from dstack._internal.core.errors import ClientError, ConfigurationError, ResourceNotExistsError
+from dstack._internal.core.errors import (
+    ClientError,
+    ConfigurationError,
+    ResourceNotExistsError,
+    StreamInterruptedError,
+    URLNotFoundError,
+)
 from dstack._internal.core.models.backends.base import BackendType
 from dstack._internal.core.models.configurations import (
     AnyRunConfiguration,
@@ -45,7 +52,7 @@ from dstack._internal.core.services.logs import URLReplacer
 from dstack._internal.core.services.ssh.attach import BaseSSHAttach, SSHAttach, SSHProxyAttach
 from dstack._internal.core.services.ssh.key_manager import UserSSHKeyManager
 from dstack._internal.core.services.ssh.ports import PortsLock
-from dstack._internal.server.schemas.logs import PollLogsRequest
+from dstack._internal.server.schemas.logs import PollLogsRequest, StreamLogsRequest
 from dstack._internal.utils.common import get_or_error, make_proxy_url
 from dstack._internal.utils.files import create_file_archive
 from dstack._internal.utils.logging import get_logger
@@ -54,6 +61,9 @@ from dstack.api.server import APIClient
 
 logger = get_logger(__name__)
 
+# Used to follow logs if the server does not support log streaming
+_LOGS_POLL_INTERVAL = 2
+
 
 class Run(ABC):
     """
@@ -201,6 +211,7 @@ class Run(ABC):
         diagnose: bool = False,
         replica_num: Optional[int] = None,
         job_num: int = 0,
+        follow: bool = False,
     ) -> Iterable[bytes]:
         """
         Iterate through run's log messages.
@@ -211,6 +222,7 @@ class Run(ABC):
             replica_num: The replica number or `None` to use any running replica,
                 falling back to the lowest-numbered replica if no replica is running.
             job_num: The job number inside the replica.
+            follow: Wait for new log messages until the job is finished if `True`.
 
         Yields:
             Log messages.
@@ -221,13 +233,38 @@ class Run(ABC):
             job = self._find_job(replica_num=replica_num, job_num=job_num)
             if job is None:
                 return
+            job_submission_id = job.job_submissions[-1].id
+            while follow:
+                try:
+                    for resp in self._api_client.logs.stream(
+                        project_name=self._project,
+                        body=StreamLogsRequest(
+                            run_name=self.name,
+                            job_submission_id=job_submission_id,
+                            start_time=start_time,
+                            diagnose=diagnose,
+                        ),
+                    ):
+                        for log in resp.logs:
+                            start_time = log.timestamp
+                            yield base64.b64decode(log.message)
+                    return
+                except URLNotFoundError:
+                    logger.debug("Log streaming is not supported by the server, polling")
+                    break
+                except StreamInterruptedError as e:
+                    logger.debug("%s, resuming", e)
+                    time.sleep(_LOGS_POLL_INTERVAL)
+            # `start_time` must not change while paging with `next_token`,
+            # otherwise logs sharing the timestamp of the last log on a page are skipped.
+            last_timestamp = start_time
             next_token = None
             while True:
                 resp = self._api_client.logs.poll(
                     project_name=self._project,
                     body=PollLogsRequest(
                         run_name=self.name,
-                        job_submission_id=job.job_submissions[-1].id,
+                        job_submission_id=job_submission_id,
                         start_time=start_time,
                         end_time=None,
                         descending=False,
@@ -237,10 +274,23 @@ class Run(ABC):
                     ),
                 )
                 for log in resp.logs:
+                    last_timestamp = log.timestamp
                     yield base64.b64decode(log.message)
                 next_token = resp.next_token
-                if next_token is None:
+                if next_token is not None:
+                    continue
+                start_time = last_timestamp
+                if not follow or self._is_job_submission_finished(job_submission_id):
                     break
+                time.sleep(_LOGS_POLL_INTERVAL)
+
+    def _is_job_submission_finished(self, job_submission_id: uuid.UUID) -> bool:
+        self.refresh()
+        for job in self._run.jobs:
+            for job_submission in job.job_submissions:
+                if job_submission.id == job_submission_id:
+                    return job_submission.status.is_finished()
+        return True
 
     def refresh(self):
         """
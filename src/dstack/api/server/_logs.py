@@ -1,7 +1,13 @@
+import json
+from typing import Iterator
+
+import requests
+
 from dstack._internal.core.compatibility.logs import get_poll_logs_excludes
+from dstack._internal.core.errors import StreamInterruptedError
 from dstack._internal.core.models.common import validate_extra_ignore
 from dstack._internal.core.models.logs import JobSubmissionLogs
-from dstack._internal.server.schemas.logs import PollLogsRequest
+from dstack._internal.server.schemas.logs import PollLogsRequest, StreamLogsRequest
 from dstack.api.server._group import APIClientGroup
 
 
@@ -12,3 +18,22 @@ class LogsAPIClient(APIClientGroup):
             body=body.model_dump_json(exclude=get_poll_logs_excludes(body)),
         )
         return validate_extra_ignore(JobSubmissionLogs, resp.json())
+
+    def stream(self, project_name: str, body: StreamLogsRequest) -> Iterator[JobSubmissionLogs]:
+        """
+        Streams logs until the job is finished. Batches without logs are heartbeats.
+        Raises `URLNotFoundError` if the server does not support streaming
+        and `StreamInterruptedError` if the connection is lost before the job is finished.
+        """
+        resp = self._request(
+            f"/api/project/{project_name}/logs/stream",
+            body=body.model_dump_json(),
+            stream=True,
+        )
+        with resp:
+            try:
+                for line in resp.iter_lines():
+                    if line:
+                        yield validate_extra_ignore(JobSubmissionLogs, json.loads(line))
+            except requests.exceptions.RequestException as e:
+                raise StreamInterruptedError(f"Log stream interrupted: {e}") from e
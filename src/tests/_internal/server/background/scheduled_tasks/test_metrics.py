@@ -1,5 +1,7 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import List
 from unittest.mock import patch
+from uuid import UUID
 
 import pytest
 from freezegun import freeze_time
@@ -10,12 +12,14 @@ from dstack._internal.core.models.instances import InstanceStatus
 from dstack._internal.core.models.runs import JobStatus
 from dstack._internal.core.models.users import GlobalRole, ProjectRole
 from dstack._internal.server import settings
+from dstack._internal.server.background.scheduled_tasks import metrics as metrics_tasks
 from dstack._internal.server.background.scheduled_tasks.metrics import (
     collect_metrics,
     delete_metrics,
 )
-from dstack._internal.server.models import JobMetricsPoint
+from dstack._internal.server.models import JobMetricsPoint, JobMetricsRollup
 from dstack._internal.server.schemas.runner import GPUMetrics, MetricsResponse
+from dstack._internal.server.services.metrics import JobMetricsAggregates, MetricAggregate
 from dstack._internal.server.services.projects import add_project_member
 from dstack._internal.server.testing.common import (
     create_instance,
@@ -89,6 +93,72 @@ class TestCollectMetrics:
         metrics_point = res.scalar_one()
         assert metrics_point.job_id == job.id
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
+    async def test_collects_metrics_of_all_jobs_in_pages(
+        self, test_db, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(metrics_tasks, "MAX_JOBS_FETCHED", 2)
+        monkeypatch.setattr(metrics_tasks, "SPREAD_INTERVAL_SECONDS", 0)
+        job_ids = await self._create_running_jobs(session, count=3)
+        with (
+            patch("dstack._internal.server.services.runner.pool.SSHTunnel"),
+            patch(
+                "dstack._internal.server.services.runner.client.RunnerClient.from_address"
+            ) as RunnerClientMock,
+        ):
+            RunnerClientMock.return_value.get_metrics.return_value = _get_metrics_response()
+            await collect_metrics()
+        res = await session.execute(select(JobMetricsPoint.job_id))
+        assert set(res.scalars().all()) == set(job_ids)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
+    async def test_skips_jobs_after_deadline(
+        self, test_db, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(metrics_tasks, "COLLECT_INTERVAL_SECONDS", 0)
+        await self._create_running_jobs(session, count=1)
+        with patch(
+            "dstack._internal.server.services.runner.client.RunnerClient.from_address"
+        ) as RunnerClientMock:
+            await collect_metrics()
+            RunnerClientMock.return_value.get_metrics.assert_not_called()
+        res = await session.execute(select(JobMetricsPoint))
+        assert res.scalars().all() == []
+
+    async def _create_running_jobs(self, session: AsyncSession, count: int) -> List[UUID]:
+        project = await create_project(session=session)
+        repo = await create_repo(session=session, project_id=project.id)
+        user = await create_user(session=session)
+        run = await create_run(session=session, project=project, repo=repo, user=user)
+        job_ids = []
+        for i in range(count):
+            instance = await create_instance(
+                session=session, project=project, status=InstanceStatus.BUSY, name=f"i-{i}"
+            )
+            job = await create_job(
+                session=session,
+                run=run,
+                status=JobStatus.RUNNING,
+                job_provisioning_data=get_job_provisioning_data(),
+                instance_assigned=True,
+                instance=instance,
+                job_num=i,
+            )
+            job_ids.append(job.id)
+        return job_ids
+
+
+def _get_metrics_response() -> MetricsResponse:
+    return MetricsResponse(
+        timestamp_micro=1,
+        cpu_usage_micro=2,
+        memory_usage_bytes=3,
+        memory_working_set_bytes=4,
+        gpus=[],
+    )
+
 
 class TestDeleteMetrics:
     @pytest.mark.asyncio
@@ -186,3 +256,94 @@ class TestDeleteMetrics:
         points = res.scalars().all()
         assert len(points) == 1
         assert points[0].id == last_metric.id
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
+    async def test_rolls_up_old_metrics_running_job(self, test_db, session: AsyncSession):
+        user = await create_user(session=session, global_role=GlobalRole.USER)
+        project = await create_project(session=session, owner=user)
+        repo = await create_repo(session=session, project_id=project.id)
+        run = await create_run(session=session, project=project, repo=repo, user=user)
+        job = await create_job(session=session, run=run, status=JobStatus.RUNNING)
+        start = datetime(2023, 1, 2, 3, 0, 5, tzinfo=timezone.utc)
+        for i in range(18):
+            await create_job_metrics_point(
+                session=session,
+                job_model=job,
+                timestamp=start + timedelta(seconds=10 * i),
+                cpu_usage_micro=i * 5_000_000,
+                memory_usage_bytes=1024 * i,
+                gpus_memory_usage_bytes=[i],
+                gpus_util_percent=[50],
+            )
+
+        now = datetime(2023, 1, 2, 4, 5, 20, tzinfo=timezone.utc)
+        with patch.object(metrics_tasks, "get_current_datetime", return_value=now):
+            await delete_metrics()
+        res = await session.execute(select(JobMetricsPoint))
+        assert res.scalars().all() == []
+        res = await session.execute(
+            select(JobMetricsRollup).order_by(JobMetricsRollup.timestamp_micro)
+        )
+        rollups = res.scalars().all()
+        assert [r.resolution_seconds for r in rollups] == [60, 60, 60]
+        assert [r.timestamp_micro for r in rollups] == [
+            int(datetime(2023, 1, 2, 3, m, tzinfo=timezone.utc).timestamp() * 1_000_000)
+            for m in range(3)
+        ]
+        first = JobMetricsAggregates.model_validate_json(rollups[0].aggregates)
+        assert first.cpu_usage_percent == MetricAggregate(min=50, max=50, sum=250, count=5)
+        assert first.memory_usage_bytes == MetricAggregate(
+            min=0, max=5 * 1024, sum=15 * 1024, count=6
+        )
+        assert first.gpus_util_percent == [MetricAggregate(min=50, max=50, sum=300, count=6)]
+
+        # 1-minute rollups are rolled up into 10-minute ones after a day.
+        now += timedelta(days=2)
+        with patch.object(metrics_tasks, "get_current_datetime", return_value=now):
+            await delete_metrics()
+        session.expunge_all()
+        res = await session.execute(select(JobMetricsRollup))
+        rollups = res.scalars().all()
+        assert len(rollups) == 1
+        assert rollups[0].resolution_seconds == 600
+        aggregates = JobMetricsAggregates.model_validate_json(rollups[0].aggregates)
+        assert aggregates.memory_usage_bytes.count == 18
+        assert aggregates.gpus_memory_usage_bytes == [
+            MetricAggregate(min=0, max=17, sum=153, count=18)
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
+    async def test_deletes_old_rollups_finished_job(self, test_db, session: AsyncSession):
+        user = await create_user(session=session, global_role=GlobalRole.USER)
+        project = await create_project(session=session, owner=user)
+        repo = await create_repo(session=session, project_id=project.id)
+        run = await create_run(session=session, project=project, repo=repo, user=user)
+        job = await create_job(session=session, run=run, status=JobStatus.DONE)
+        for minute in (0, 10):
+            session.add(
+                JobMetricsRollup(
+                    job_id=job.id,
+                    resolution_seconds=60,
+                    timestamp_micro=int(
+                        datetime(2023, 1, 2, 3, minute, tzinfo=timezone.utc).timestamp()
+                        * 1_000_000
+                    ),
+                    aggregates="{}",
+                )
+            )
+        await session.commit()
+
+        now = datetime(2023, 1, 2, 3, 15, tzinfo=timezone.utc)
+        with (
+            patch.object(metrics_tasks, "get_current_datetime", return_value=now),
+            patch.multiple(settings, SERVER_METRICS_FINISHED_TTL_SECONDS=600),
+        ):
+            await delete_metrics()
+        res = await session.execute(select(JobMetricsRollup))
+        rollups = res.scalars().all()
+        assert len(rollups) == 1
+        assert rollups[0].timestamp_micro == int(
+            datetime(2023, 1, 2, 3, 10, tzinfo=timezone.utc).timestamp() * 1_000_000
+        )
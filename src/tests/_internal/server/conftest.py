@@ -11,6 +11,7 @@ from dstack._internal.server.services import encryption as encryption  # import
 from dstack._internal.server.services import logs as logs_services
 from dstack._internal.server.services.docker import ImageConfig, ImageConfigObject
 from dstack._internal.server.services.logs.filelog import FileLogStorage
+from dstack._internal.server.services.parse_cache import parse_cache
 from dstack._internal.server.testing.conf import (  # noqa: F401
     postgres_container,
     server_dir,
@@ -46,6 +47,16 @@ def _warm_up_route_schemas() -> None:
 _warm_up_route_schemas()
 
 
+@pytest.fixture(autouse=True)
+def verify_parse_cache() -> Generator[None, None, None]:
+    """
+    Fails tests that mutate models shared via the parse cache.
+    """
+    parse_cache.verify = True
+    yield
+    parse_cache.clear()
+
+
 @pytest.fixture
 def client():
     transport = httpx.ASGITransport(app=app)
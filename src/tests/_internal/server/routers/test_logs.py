@@ -1,11 +1,28 @@
+import asyncio
+import base64
+import json
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from dstack._internal.core.models.logs import LogProducer
+from dstack._internal.core.models.runs import JobStatus
 from dstack._internal.core.models.users import GlobalRole, ProjectRole
+from dstack._internal.server.schemas.logs import StreamLogsRequest
+from dstack._internal.server.schemas.runner import LogEvent as RunnerLogEvent
+from dstack._internal.server.services import logs as logs_services
+from dstack._internal.server.services.logs.fanout import get_log_fanout
 from dstack._internal.server.services.logs.filelog import FileLogStorage
 from dstack._internal.server.services.projects import add_project_member
-from dstack._internal.server.testing.common import create_project, create_user, get_auth_headers
+from dstack._internal.server.testing.common import (
+    create_job,
+    create_project,
+    create_repo,
+    create_run,
+    create_user,
+    get_auth_headers,
+)
 
 
 class TestPollLogs:
@@ -100,3 +117,197 @@ class TestPollLogs:
             "external_url": None,
             "next_token": None,
         }
+
+
+class TestStreamLogs:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
+    async def test_returns_403_if_not_project_member(
+        self, test_db, session: AsyncSession, client: AsyncClient
+    ):
+        user = await create_user(session=session, global_role=GlobalRole.USER)
+        project = await create_project(session=session, owner=user)
+        response = await client.post(
+            f"/api/project/{project.name}/logs/stream",
+            headers=get_auth_headers(user.token),
+        )
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
+    async def test_returns_stored_logs_of_finished_job(
+        self, test_db, test_log_storage: FileLogStorage, session: AsyncSession, client: AsyncClient
+    ):
+        user = await create_user(session=session, global_role=GlobalRole.USER)
+        project = await create_project(session=session, owner=user)
+        await add_project_member(
+            session=session, project=project, user=user, project_role=ProjectRole.USER
+        )
+        repo = await create_repo(session=session, project_id=project.id)
+        run = await create_run(
+            session=session, project=project, repo=repo, user=user, run_name="test_run"
+        )
+        job = await create_job(session=session, run=run, status=JobStatus.DONE)
+        logs_services.write_logs(
+            project=project,
+            run_name="test_run",
+            job_submission_id=job.id,
+            runner_logs=[],
+            job_logs=[
+                RunnerLogEvent(timestamp=1696586513234, message=b"Hello"),
+                RunnerLogEvent(timestamp=1696586513235, message=b"World"),
+            ],
+        )
+        response = await client.post(
+            f"/api/project/{project.name}/logs/stream",
+            headers=get_auth_headers(user.token),
+            json={"run_name": "test_run", "job_submission_id": str(job.id)},
+        )
+        assert response.status_code == 200
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {
+                "logs": [
+                    {
+                        "timestamp": "2023-10-06T10:01:53.234000Z",
+                        "log_source": "stdout",
+                        "message": "SGVsbG8=",
+                    },
+                    {
+                        "timestamp": "2023-10-06T10:01:53.235000Z",
+                        "log_source": "stdout",
+                        "message": "V29ybGQ=",
+                    },
+                ],
+                "external_url": None,
+                "next_token": None,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
+    async def test_pages_logs_with_equal_timestamps(
+        self,
+        test_db,
+        test_log_storage: FileLogStorage,
+        session: AsyncSession,
+        client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(logs_services, "_STREAM_PAGE_LIMIT", 2)
+        user = await create_user(session=session, global_role=GlobalRole.USER)
+        project = await create_project(session=session, owner=user)
+        await add_project_member(
+            session=session, project=project, user=user, project_role=ProjectRole.USER
+        )
+        repo = await create_repo(session=session, project_id=project.id)
+        run = await create_run(
+            session=session, project=project, repo=repo, user=user, run_name="test_run"
+        )
+        job = await create_job(session=session, run=run, status=JobStatus.DONE)
+        logs_services.write_logs(
+            project=project,
+            run_name="test_run",
+            job_submission_id=job.id,
+            runner_logs=[],
+            job_logs=[
+                RunnerLogEvent(timestamp=1696586513234 + i // 3, message=f"l{i}".encode())
+                for i in range(6)
+            ],
+        )
+        response = await client.post(
+            f"/api/project/{project.name}/logs/stream",
+            headers=get_auth_headers(user.token),
+            json={"run_name": "test_run", "job_submission_id": str(job.id)},
+        )
+        assert response.status_code == 200
+        messages = [
+            base64.b64decode(log["message"])
+            for line in response.text.splitlines()
+            for log in json.loads(line)["logs"]
+        ]
+        assert messages == [f"l{i}".encode() for i in range(6)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
+    async def test_sends_heartbeats_while_idle(
+        self,
+        test_db,
+        test_log_storage: FileLogStorage,
+        session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(logs_services, "_STREAM_RESYNC_INTERVAL", 0.01)
+        user = await create_user(session=session)
+        project = await create_project(session=session, owner=user)
+        repo = await create_repo(session=session, project_id=project.id)
+        run = await create_run(
+            session=session, project=project, repo=repo, user=user, run_name="test_run"
+        )
+        job = await create_job(session=session, run=run, status=JobStatus.RUNNING)
+        stream = logs_services.stream_logs(
+            project=project,
+            request=StreamLogsRequest(run_name="test_run", job_submission_id=job.id),
+        )
+        try:
+            job_submission_logs = await asyncio.wait_for(stream.__anext__(), timeout=5)
+        finally:
+            await stream.aclose()
+        assert job_submission_logs.logs == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
+    async def test_streams_new_logs_until_job_finished(
+        self,
+        test_db,
+        test_log_storage: FileLogStorage,
+        session: AsyncSession,
+        client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(logs_services, "_STREAM_RESYNC_INTERVAL", 0.1)
+        user = await create_user(session=session, global_role=GlobalRole.USER)
+        project = await create_project(session=session, owner=user)
+        await add_project_member(
+            session=session, project=project, user=user, project_role=ProjectRole.USER
+        )
+        repo = await create_repo(session=session, project_id=project.id)
+        run = await create_run(
+            session=session, project=project, repo=repo, user=user, run_name="test_run"
+        )
+        job = await create_job(session=session, run=run, status=JobStatus.RUNNING)
+        logs_services.write_logs(
+            project=project,
+            run_name="test_run",
+            job_submission_id=job.id,
+            runner_logs=[],
+            job_logs=[RunnerLogEvent(timestamp=1696586513234, message=b"Stored")],
+        )
+        request_task = asyncio.create_task(
+            client.post(
+                f"/api/project/{project.name}/logs/stream",
+                headers=get_auth_headers(user.token),
+                json={"run_name": "test_run", "job_submission_id": str(job.id)},
+            )
+        )
+        fanout = get_log_fanout()
+        while (job.id, LogProducer.JOB) not in fanout._subscriptions:
+            await asyncio.sleep(0.01)
+        logs_services.write_logs(
+            project=project,
+            run_name="test_run",
+            job_submission_id=job.id,
+            runner_logs=[],
+            job_logs=[RunnerLogEvent(timestamp=1696586513235, message=b"Live")],
+        )
+        await asyncio.sleep(0.05)
+        job.status = JobStatus.DONE
+        await session.commit()
+        response = await asyncio.wait_for(request_task, timeout=5)
+        assert response.status_code == 200
+        messages = [
+            log["message"]
+            for line in response.text.splitlines()
+            for log in json.loads(line)["logs"]
+        ]
+        assert messages == ["U3RvcmVk", "TGl2ZQ=="]
+        assert (job.id, LogProducer.JOB) not in fanout._subscriptions
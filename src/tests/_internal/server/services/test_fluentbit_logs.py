@@ -73,15 +73,9 @@ class TestHTTPFluentBitWriter:
         ]
         writer.write(tag="test-tag", records=records)
 
-        assert mock_httpx_client.post.call_count == 2
-        mock_httpx_client.post.assert_any_call(
-            "http://localhost:8080/dstack.test-tag",
-            json=records[0],
-            headers={"Content-Type": "application/json"},
-        )
-        mock_httpx_client.post.assert_any_call(
+        mock_httpx_client.post.assert_called_once_with(
             "http://localhost:8080/dstack.test-tag",
-            json=records[1],
+            json=records,
             headers={"Content-Type": "application/json"},
         )
 
@@ -133,7 +127,7 @@ class TestHTTPFluentBitWriter:
 
         mock_httpx_client.post.assert_called_once_with(
             "http://localhost:8080/dstack.project/run/job",
-            json=records[0],
+            json=records,
             headers={"Content-Type": "application/json"},
         )
 
@@ -145,7 +139,7 @@ class TestHTTPFluentBitWriter:
 
         mock_httpx_client.post.assert_called_once_with(
             "http://localhost:8080/test-tag",
-            json=records[0],
+            json=records,
             headers={"Content-Type": "application/json"},
         )
 
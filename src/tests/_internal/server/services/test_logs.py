@@ -1,4 +1,5 @@
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List
@@ -16,14 +17,38 @@ from dstack._internal.core.models.logs import LogEvent, LogEventSource, LogProdu
 from dstack._internal.server.models import ProjectModel
 from dstack._internal.server.schemas.logs import PollLogsRequest
 from dstack._internal.server.schemas.runner import LogEvent as RunnerLogEvent
+from dstack._internal.server.services.logs import filelog
 from dstack._internal.server.services.logs.aws import (
     CloudWatchLogStorage,
 )
-from dstack._internal.server.services.logs.base import LogStorageError
+from dstack._internal.server.services.logs.base import (
+    LogStorage,
+    LogStorageError,
+    LogWrite,
+    LogWritesError,
+)
+from dstack._internal.server.services.logs.buffered import BufferedLogStorage
 from dstack._internal.server.services.logs.filelog import FileLogStorage
 from dstack._internal.server.testing.common import create_project
 
 
+def _runner_log_path(root: Path, project: ProjectModel) -> Path:
+    return (
+        root
+        / "projects"
+        / project.name
+        / "logs"
+        / "test_run"
+        / "1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"
+        / "runner.log"
+    )
+
+
+def _offset_token(root: Path, project: ProjectModel, line: int) -> str:
+    lines = _runner_log_path(root, project).read_bytes().splitlines(keepends=True)
+    return f"b{sum(len(lines[i]) for i in range(line))}"
+
+
 class TestFileLogStorage:
     @pytest.mark.asyncio
     @pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
@@ -120,7 +145,7 @@ class TestFileLogStorage:
         assert len(job_submission_logs.logs) == 2
         assert job_submission_logs.logs[0].message == "Log1"
         assert job_submission_logs.logs[1].message == "Log2"
-        assert job_submission_logs.next_token == "2"  # Next line to read
+        assert job_submission_logs.next_token == _offset_token(tmp_path, project, line=2)
 
         # Second page: use next_token
         poll_request.next_token = job_submission_logs.next_token
@@ -129,7 +154,7 @@ class TestFileLogStorage:
         assert len(job_submission_logs.logs) == 2
         assert job_submission_logs.logs[0].message == "Log3"
         assert job_submission_logs.logs[1].message == "Log4"
-        assert job_submission_logs.next_token == "4"  # Next line to read
+        assert job_submission_logs.next_token == _offset_token(tmp_path, project, line=4)
 
         # Third page: get remaining log
         poll_request.next_token = job_submission_logs.next_token
@@ -264,7 +289,7 @@ class TestFileLogStorage:
         # Should get Log3 first (timestamp > 235)
         assert len(job_submission_logs.logs) == 1
         assert job_submission_logs.logs[0].message == "Log3"
-        assert job_submission_logs.next_token == "3"
+        assert job_submission_logs.next_token == _offset_token(tmp_path, project, line=3)
 
         # Get next page
         poll_request.next_token = job_submission_logs.next_token
@@ -342,7 +367,7 @@ class TestFileLogStorage:
         assert page1.logs[0].message == "Log1"
         assert page1.logs[1].message == "Log2"
         assert page1.logs[2].message == "Log3"
-        assert page1.next_token == "3"  # Next line to read
+        assert page1.next_token == _offset_token(tmp_path, project, line=3)
 
         # Second page: use next_token
         poll_request.next_token = page1.next_token
@@ -352,7 +377,7 @@ class TestFileLogStorage:
         assert page2.logs[0].message == "Log4"
         assert page2.logs[1].message == "Log5"
         assert page2.logs[2].message == "Log6"
-        assert page2.next_token == "6"
+        assert page2.next_token == _offset_token(tmp_path, project, line=6)
 
         # Third page: get more logs
         poll_request.next_token = page2.next_token
@@ -362,7 +387,7 @@ class TestFileLogStorage:
         assert page3.logs[0].message == "Log7"
         assert page3.logs[1].message == "Log8"
         assert page3.logs[2].message == "Log9"
-        assert page3.next_token == "9"
+        assert page3.next_token == _offset_token(tmp_path, project, line=9)
 
         # Fourth page: get last log
         poll_request.next_token = page3.next_token
@@ -410,7 +435,7 @@ class TestFileLogStorage:
         assert len(page1.logs) == 2
         assert page1.logs[0].message == "Log3"
         assert page1.logs[1].message == "Log4"
-        assert page1.next_token == "4"
+        assert page1.next_token == _offset_token(tmp_path, project, line=4)
 
         # Get next page
         poll_request.next_token = page1.next_token
@@ -493,6 +518,246 @@ class TestFileLogStorage:
         assert len(result.logs) == 0
         assert result.next_token is None
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite"], indirect=True)
+    async def test_poll_logs_with_index(
+        self,
+        test_db,
+        session: AsyncSession,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(filelog, "_INDEX_BLOCK_SIZE", 256)
+        project = await create_project(session=session)
+        log_storage = FileLogStorage(tmp_path)
+        # Several writes to extend and start index blocks
+        for batch in range(10):
+            log_storage.write_logs(
+                project=project,
+                run_name="test_run",
+                job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+                runner_logs=[
+                    RunnerLogEvent(
+                        timestamp=1696586513000 + (batch * 10 + i) * 100,
+                        message=f"Log{batch * 10 + i}".encode(),
+                    )
+                    for i in range(10)
+                ],
+                job_logs=[],
+            )
+        index_path = _runner_log_path(tmp_path, project).with_suffix(".log.idx")
+        assert index_path.stat().st_size > filelog._INDEX_RECORD.size
+
+        # Legacy line number token
+        poll_request = PollLogsRequest(
+            run_name="test_run",
+            job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+            next_token="57",
+            limit=2,
+            diagnose=True,
+        )
+        result = log_storage.poll_logs(project, poll_request)
+        assert [log.message for log in result.logs] == ["Log57", "Log58"]
+        assert result.next_token == _offset_token(tmp_path, project, line=59)
+
+        # Offset token
+        poll_request.next_token = result.next_token
+        result = log_storage.poll_logs(project, poll_request)
+        assert [log.message for log in result.logs] == ["Log59", "Log60"]
+
+        # Start time
+        poll_request = PollLogsRequest(
+            run_name="test_run",
+            job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+            start_time=datetime.fromtimestamp(1696586513.000 + 7.35, tz=timezone.utc),
+            limit=2,
+            diagnose=True,
+        )
+        result = log_storage.poll_logs(project, poll_request)
+        assert [log.message for log in result.logs] == ["Log74", "Log75"]
+
+        # End time, descending
+        poll_request = PollLogsRequest(
+            run_name="test_run",
+            job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+            end_time=datetime.fromtimestamp(1696586513.000 + 3.35, tz=timezone.utc),
+            descending=True,
+            limit=2,
+            diagnose=True,
+        )
+        result = log_storage.poll_logs(project, poll_request)
+        assert [log.message for log in result.logs] == ["Log33", "Log32"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite"], indirect=True)
+    # One gzip member per segment and multiple members per segment
+    @pytest.mark.parametrize("gzip_member_size", [256 * 1024, 150])
+    async def test_poll_logs_across_segments(
+        self,
+        test_db,
+        session: AsyncSession,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        gzip_member_size: int,
+    ):
+        monkeypatch.setattr(filelog, "_INDEX_BLOCK_SIZE", 256)
+        monkeypatch.setattr(filelog, "_GZIP_MEMBER_SIZE", gzip_member_size)
+        project = await create_project(session=session)
+        log_storage = FileLogStorage(tmp_path, segment_size=1000)
+        for batch in range(10):
+            log_storage.write_logs(
+                project=project,
+                run_name="test_run",
+                job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+                runner_logs=[
+                    RunnerLogEvent(
+                        timestamp=1696586513000 + (batch * 10 + i) * 100,
+                        message=f"Log{batch * 10 + i}".encode(),
+                    )
+                    for i in range(10)
+                ],
+                job_logs=[],
+            )
+        log_dir = _runner_log_path(tmp_path, project).parent
+        assert (log_dir / "runner.log.gz").exists()
+        assert (log_dir / "runner.000001.log.gz").exists()
+        assert (log_dir / "runner.log.segments.json").exists()
+        assert not (log_dir / "runner.log").exists()
+        manifest = log_storage._read_manifest(_runner_log_path(tmp_path, project))
+        if gzip_member_size < 1000:
+            assert len(manifest.sealed[0].members) > 1
+        expected = [f"Log{i}" for i in range(100)]
+
+        # Ascending pagination with offset tokens
+        poll_request = PollLogsRequest(
+            run_name="test_run",
+            job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+            limit=7,
+            diagnose=True,
+        )
+        messages = []
+        while True:
+            result = log_storage.poll_logs(project, poll_request)
+            messages.extend(log.message for log in result.logs)
+            if result.next_token is None:
+                break
+            poll_request.next_token = result.next_token
+        assert messages == expected
+
+        # Descending pagination
+        poll_request = PollLogsRequest(
+            run_name="test_run",
+            job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+            descending=True,
+            limit=7,
+            diagnose=True,
+        )
+        messages = []
+        while True:
+            result = log_storage.poll_logs(project, poll_request)
+            messages.extend(log.message for log in result.logs)
+            if result.next_token is None:
+                break
+            poll_request.next_token = result.next_token
+        assert messages == expected[::-1]
+
+        # Legacy line number token
+        poll_request = PollLogsRequest(
+            run_name="test_run",
+            job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+            next_token="57",
+            limit=2,
+            diagnose=True,
+        )
+        result = log_storage.poll_logs(project, poll_request)
+        assert [log.message for log in result.logs] == ["Log57", "Log58"]
+
+        # Time range
+        poll_request = PollLogsRequest(
+            run_name="test_run",
+            job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+            start_time=datetime.fromtimestamp(1696586513.000 + 7.35, tz=timezone.utc),
+            end_time=datetime.fromtimestamp(1696586513.000 + 7.75, tz=timezone.utc),
+            diagnose=True,
+        )
+        result = log_storage.poll_logs(project, poll_request)
+        assert [log.message for log in result.logs] == ["Log74", "Log75", "Log76", "Log77"]
+        poll_request.descending = True
+        result = log_storage.poll_logs(project, poll_request)
+        assert [log.message for log in result.logs] == ["Log77", "Log76", "Log75", "Log74"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite"], indirect=True)
+    async def test_reads_segment_sealed_after_listing(
+        self, test_db, session: AsyncSession, tmp_path: Path
+    ):
+        project = await create_project(session=session)
+        log_storage = FileLogStorage(tmp_path, segment_size=1000)
+        job_submission_id = UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e")
+        log_storage.write_logs(
+            project=project,
+            run_name="test_run",
+            job_submission_id=job_submission_id,
+            runner_logs=[
+                RunnerLogEvent(timestamp=1696586513000 + i, message=f"Log{i}".encode())
+                for i in range(6)
+            ],
+            job_logs=[],
+        )
+        log_path = _runner_log_path(tmp_path, project)
+        # A reader lists segments, then the active segment is sealed and removed
+        segments = log_storage._get_segments(log_path)
+        log_storage._seal_active_segment(log_path, log_storage._read_manifest(log_path))
+        assert not log_path.exists()
+        lines = list(log_storage._read_lines(log_path, segments, 0))
+        assert len(lines) == 6
+        lines = list(log_storage._read_segment_lines_reversed(log_path, segments))
+        assert len([line for line, _ in lines if line]) == 6
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("test_db", ["sqlite"], indirect=True)
+    async def test_indexes_legacy_log_file_on_write(
+        self,
+        test_db,
+        session: AsyncSession,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(filelog, "_INDEX_BLOCK_SIZE", 256)
+        project = await create_project(session=session)
+        log_storage = FileLogStorage(tmp_path)
+        log_path = _runner_log_path(tmp_path, project)
+        log_path.parent.mkdir(parents=True)
+        # A file without the index, as written by older server versions
+        log_path.write_text(
+            "".join(
+                LogEvent(
+                    timestamp=datetime.fromtimestamp(1696586513 + i, tz=timezone.utc),
+                    log_source=LogEventSource.STDOUT,
+                    message=f"Log{i}",
+                ).model_dump_json()
+                + "\n"
+                for i in range(20)
+            )
+        )
+        log_storage.write_logs(
+            project=project,
+            run_name="test_run",
+            job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+            runner_logs=[RunnerLogEvent(timestamp=1696586533000, message=b"Log20")],
+            job_logs=[],
+        )
+        poll_request = PollLogsRequest(
+            run_name="test_run",
+            job_submission_id=UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e"),
+            next_token="18",
+            limit=10,
+            diagnose=True,
+        )
+        result = log_storage.poll_logs(project, poll_request)
+        assert [log.message for log in result.logs] == ["Log18", "Log19", "Log20"]
+        assert result.next_token is None
+
 
 class TestPollLogsRequestValidation:
     @pytest.mark.asyncio
@@ -1994,6 +2259,134 @@ class TestCloudWatchLogStorage:
         assert mock_client.get_log_events.call_count == 1
 
 
+class TestBufferedLogStorage:
+    JOB_SUBMISSION_ID = UUID("1b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e")
+
+    @pytest.fixture
+    def project(self) -> Mock:
+        project = Mock(spec=ProjectModel)
+        project.name = "test-proj"
+        return project
+
+    @pytest.fixture
+    def inner_storage(self) -> Mock:
+        return Mock(spec=LogStorage)
+
+    @pytest.fixture
+    def log_storage(self, inner_storage: Mock):
+        # A long interval so that flushes are triggered by tests
+        log_storage = BufferedLogStorage(inner_storage, flush_interval=3600, max_size=1000)
+        yield log_storage
+        log_storage.close()
+
+    def _write(self, log_storage: LogStorage, project: Mock, message: bytes, **kwargs) -> None:
+        log_storage.write_logs(
+            project=project,
+            run_name=kwargs.get("run_name", "test-run"),
+            job_submission_id=kwargs.get("job_submission_id", self.JOB_SUBMISSION_ID),
+            runner_logs=[RunnerLogEvent(timestamp=1, message=message)],
+            job_logs=[],
+        )
+
+    def test_coalesces_writes_per_job_submission(
+        self, log_storage: BufferedLogStorage, inner_storage: Mock, project: Mock
+    ):
+        other_job_submission_id = UUID("2b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e")
+        self._write(log_storage, project, b"one")
+        self._write(log_storage, project, b"two")
+        self._write(log_storage, project, b"three", job_submission_id=other_job_submission_id)
+        inner_storage.write_logs_many.assert_not_called()
+        log_storage.flush()
+        inner_storage.write_logs_many.assert_called_once_with(
+            [
+                LogWrite(
+                    project=project,
+                    run_name="test-run",
+                    job_submission_id=self.JOB_SUBMISSION_ID,
+                    runner_logs=[
+                        RunnerLogEvent(timestamp=1, message=b"one"),
+                        RunnerLogEvent(timestamp=1, message=b"two"),
+                    ],
+                ),
+                LogWrite(
+                    project=project,
+                    run_name="test-run",
+                    job_submission_id=other_job_submission_id,
+                    runner_logs=[RunnerLogEvent(timestamp=1, message=b"three")],
+                ),
+            ]
+        )
+
+    def test_close_flushes_and_writes_through(self, inner_storage: Mock, project: Mock):
+        log_storage = BufferedLogStorage(inner_storage, flush_interval=3600, max_size=1000)
+        self._write(log_storage, project, b"one")
+        log_storage.close()
+        inner_storage.write_logs_many.assert_called_once()
+        inner_storage.close.assert_called_once()
+        self._write(log_storage, project, b"two")
+        inner_storage.write_logs.assert_called_once()
+
+    def test_retries_failed_writes_then_drops(
+        self, log_storage: BufferedLogStorage, inner_storage: Mock, project: Mock
+    ):
+        inner_storage.write_logs_many.side_effect = LogStorageError("unavailable")
+        self._write(log_storage, project, b"one")
+        log_storage.flush()
+        self._write(log_storage, project, b"two")
+        log_storage.flush()
+        writes = inner_storage.write_logs_many.call_args.args[0]
+        assert writes[0].runner_logs == [
+            RunnerLogEvent(timestamp=1, message=b"one"),
+            RunnerLogEvent(timestamp=1, message=b"two"),
+        ]
+        for _ in range(BufferedLogStorage.MAX_WRITE_ATTEMPTS - 2):
+            log_storage.flush()
+        assert inner_storage.write_logs_many.call_count == BufferedLogStorage.MAX_WRITE_ATTEMPTS
+        log_storage.flush()
+        assert inner_storage.write_logs_many.call_count == BufferedLogStorage.MAX_WRITE_ATTEMPTS
+
+    def test_retries_only_failed_writes(
+        self, log_storage: BufferedLogStorage, inner_storage: Mock, project: Mock
+    ):
+        other_job_submission_id = UUID("2b0e1b45-2f8c-4ab6-8010-a0d1a3e44e0e")
+        self._write(log_storage, project, b"one")
+        self._write(log_storage, project, b"two", job_submission_id=other_job_submission_id)
+
+        def write_logs_many(writes: List[LogWrite]):
+            raise LogWritesError(writes[1:], LogStorageError("unavailable"))
+
+        inner_storage.write_logs_many.side_effect = write_logs_many
+        log_storage.flush()
+        inner_storage.write_logs_many.side_effect = None
+        log_storage.flush()
+        writes = inner_storage.write_logs_many.call_args.args[0]
+        assert len(writes) == 1
+        assert writes[0].job_submission_id == other_job_submission_id
+
+    def test_blocks_writes_when_full(self, inner_storage: Mock, project: Mock):
+        log_storage = BufferedLogStorage(inner_storage, flush_interval=3600, max_size=10)
+        flushing = threading.Event()
+        finish_flush = threading.Event()
+
+        def write_logs_many(writes: List[LogWrite]):
+            flushing.set()
+            finish_flush.wait()
+
+        inner_storage.write_logs_many.side_effect = write_logs_many
+        # Fills the buffer and triggers a flush that blocks
+        self._write(log_storage, project, b"0123456789")
+        assert flushing.wait(timeout=5)
+        writer = threading.Thread(target=self._write, args=(log_storage, project, b"next"))
+        writer.start()
+        writer.join(timeout=0.1)
+        assert writer.is_alive()
+        finish_flush.set()
+        writer.join(timeout=5)
+        assert not writer.is_alive()
+        log_storage.close()
+        assert inner_storage.write_logs_many.call_count == 2
+
+
 class TestFileLogStorageReadLinesReversed:
     # No changes to the first 6 tests, they will now pass.
     def test_basic_file(self, tmp_path: Path):
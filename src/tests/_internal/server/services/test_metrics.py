@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from dstack._internal.core.models.metrics import Metric
-from dstack._internal.server.services.metrics import get_job_metrics
+from dstack._internal.server.models import JobMetricsPoint, JobModel
+from dstack._internal.server.services.metrics import get_job_metrics, rollup_job_metrics_points
 from dstack._internal.server.testing.common import (
     create_job,
     create_job_metrics_point,
@@ -165,3 +167,66 @@ class TestGetMetrics:
             Metric(name="gpu_util_percent_gpu0", timestamps=ts, values=gpu0_util),
             Metric(name="gpu_util_percent_gpu1", timestamps=ts, values=gpu1_util),
         ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("test_db", ["sqlite", "postgres"], indirect=True)
+@pytest.mark.usefixtures("test_db", "image_config_mock")
+class TestGetRolledUpMetrics:
+    start = datetime(2023, 1, 2, 3, 0, 5, tzinfo=timezone.utc)
+
+    async def _create_job_with_points(self, session: AsyncSession) -> JobModel:
+        user = await create_user(session=session)
+        project = await create_project(session=session, owner=user)
+        repo = await create_repo(session=session, project_id=project.id)
+        run = await create_run(session=session, project=project, repo=repo, user=user)
+        job = await create_job(session=session, run=run)
+        # 3 minutes of points, 2 cpu seconds per 10 seconds (20%) in the first minute,
+        # 5 cpu seconds (50%) afterwards.
+        cpu_usage_sec = 0
+        for i in range(18):
+            cpu_usage_sec += 2 if i <= 5 else 5
+            await create_job_metrics_point(
+                session=session,
+                job_model=job,
+                timestamp=self.start + timedelta(seconds=10 * i),
+                cpu_usage_micro=cpu_usage_sec * 1_000_000,
+                memory_usage_bytes=100 * (i // 6 + 1),
+            )
+        return job
+
+    async def test_aggregates_points_into_buckets(self, session: AsyncSession):
+        job = await self._create_job_with_points(session)
+
+        metrics = await get_job_metrics(session, job, after=self.start, resolution_seconds=60)
+
+        ts = [datetime(2023, 1, 2, 3, m, tzinfo=timezone.utc) for m in (2, 1, 0)]
+        assert metrics.metrics[:2] == [
+            Metric(name="cpu_usage_percent", timestamps=ts, values=[50, 50, 20]),
+            Metric(name="memory_usage_bytes", timestamps=ts, values=[300, 200, 100]),
+        ]
+
+    async def test_returns_same_metrics_after_rollup(self, session: AsyncSession):
+        job = await self._create_job_with_points(session)
+        expected = await get_job_metrics(session, job, after=self.start, resolution_seconds=60)
+
+        cutoff = datetime(2023, 1, 2, 3, 2, tzinfo=timezone.utc)
+        assert await rollup_job_metrics_points(
+            session, [job.id], int(cutoff.timestamp() * 1_000_000)
+        )
+
+        res = await session.execute(select(JobMetricsPoint))
+        assert len(res.scalars().all()) == 6
+        metrics = await get_job_metrics(session, job, after=self.start, resolution_seconds=60)
+        # The first point after the cutoff has no previous point for cpu_usage_percent.
+        assert metrics.metrics[0].values == [50, 50, 20]
+        assert metrics.metrics[1:] == expected.metrics[1:]
+
+    async def test_picks_resolution_by_time_range(self, session: AsyncSession):
+        job = await self._create_job_with_points(session)
+
+        metrics = await get_job_metrics(session, job, after=self.start - timedelta(days=7))
+        assert metrics.metrics[0].timestamps == [datetime(2023, 1, 2, 3, tzinfo=timezone.utc)]
+
+        metrics = await get_job_metrics(session, job, after=self.start - timedelta(minutes=30))
+        assert len(metrics.metrics[0].timestamps) == 17
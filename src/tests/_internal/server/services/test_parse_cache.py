@@ -0,0 +1,54 @@
+import uuid
+
+import pytest
+
+from dstack._internal.core.models.runs import JobProvisioningData
+from dstack._internal.server.services.parse_cache import ParseCache, ParseCacheError
+from dstack._internal.server.testing.common import get_job_provisioning_data
+
+
+class TestParseCache:
+    def test_returns_cached_model_while_content_is_unchanged(self):
+        cache = ParseCache(max_size=2**20)
+        row_id = uuid.uuid4()
+        data = get_job_provisioning_data(hostname="1.1.1.1").model_dump_json()
+
+        first = cache.parse(JobProvisioningData, row_id, data)
+        assert cache.parse(JobProvisioningData, row_id, data) is first
+
+        new_data = get_job_provisioning_data(hostname="2.2.2.2").model_dump_json()
+        second = cache.parse(JobProvisioningData, row_id, new_data)
+        assert second is not first
+        assert second.hostname == "2.2.2.2"
+
+    def test_does_not_cache_rows_without_id(self):
+        cache = ParseCache(max_size=2**20)
+        data = get_job_provisioning_data().model_dump_json()
+
+        first = cache.parse(JobProvisioningData, None, data)
+        assert cache.parse(JobProvisioningData, None, data) is not first
+
+    def test_evicts_least_recently_used_entries(self):
+        data = get_job_provisioning_data().model_dump_json()
+        cache = ParseCache(max_size=2 * len(data))
+        row_ids = [uuid.uuid4() for _ in range(3)]
+        models = [cache.parse(JobProvisioningData, row_id, data) for row_id in row_ids[:2]]
+        # Make the first entry the most recently used one.
+        assert cache.parse(JobProvisioningData, row_ids[0], data) is models[0]
+
+        cache.parse(JobProvisioningData, row_ids[2], data)
+
+        assert cache.parse(JobProvisioningData, row_ids[0], data) is models[0]
+        assert cache.parse(JobProvisioningData, row_ids[1], data) is not models[1]
+
+    def test_verify_detects_mutated_models(self):
+        cache = ParseCache(max_size=2**20)
+        cache.verify = True
+        row_id = uuid.uuid4()
+        data = get_job_provisioning_data(hostname="1.1.1.1").model_dump_json()
+        model = cache.parse(JobProvisioningData, row_id, data)
+
+        model.hostname = "2.2.2.2"
+
+        with pytest.raises(ParseCacheError):
+            cache.parse(JobProvisioningData, row_id, data)
@@ -2,6 +2,9 @@ import base64
 import uuid
 from datetime import datetime, timezone
 
+import pytest
+
+from dstack._internal.core.errors import StreamInterruptedError
 from dstack._internal.core.models.configurations import TaskConfiguration
 from dstack._internal.core.models.logs import JobSubmissionLogs, LogEvent, LogEventSource
 from dstack._internal.core.models.resources import ResourcesSpec
@@ -15,7 +18,8 @@ from dstack._internal.core.models.runs import (
     RunStatus,
 )
 from dstack._internal.core.models.runs import Run as RunModel
-from dstack._internal.server.schemas.logs import PollLogsRequest
+from dstack._internal.server.schemas.logs import PollLogsRequest, StreamLogsRequest
+from dstack.api._public import runs as runs_module
 from dstack.api._public.runs import Run, RunCollection
 
 
@@ -67,6 +71,27 @@ class _LogsAPI:
         )
 
 
+class _InterruptedStreamLogsAPI:
+    def __init__(self):
+        self.requests: list[StreamLogsRequest] = []
+
+    def stream(self, project_name: str, body: StreamLogsRequest):
+        self.requests.append(body)
+        if len(self.requests) == 1:
+            yield JobSubmissionLogs(logs=[_get_log_event(b"before\n", second=5)])
+            raise StreamInterruptedError("Log stream interrupted")
+        yield JobSubmissionLogs(logs=[])
+        yield JobSubmissionLogs(logs=[_get_log_event(b"after\n", second=6)])
+
+
+def _get_log_event(message: bytes, second: int) -> LogEvent:
+    return LogEvent(
+        timestamp=datetime(2023, 1, 2, 3, 4, second, tzinfo=timezone.utc),
+        log_source=LogEventSource.STDOUT,
+        message=base64.b64encode(message).decode(),
+    )
+
+
 def _get_job(replica_num: int, status: JobStatus, job_num: int = 0) -> Job:
     return Job(
         job_spec=JobSpec(
@@ -166,3 +191,16 @@ class TestRunLogs:
         run = _get_run(run_model, logs_api)
 
         assert b"".join(run.logs(replica_num=1)) == b"replica 1\n"
+
+    def test_follow_resumes_interrupted_stream(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(runs_module, "_LOGS_POLL_INTERVAL", 0)
+        job = _get_job(replica_num=0, status=JobStatus.RUNNING)
+        run_model = _get_run_model(status=RunStatus.RUNNING, jobs=[job])
+        logs_api = _InterruptedStreamLogsAPI()
+        run = _get_run(run_model, logs_api)  # type: ignore[arg-type]
+
+        assert b"".join(run.logs(follow=True)) == b"before\nafter\n"
+        assert [r.start_time for r in logs_api.requests] == [
+            None,
+            datetime(2023, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        ]